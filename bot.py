@@ -4,8 +4,14 @@ Coordinates scanner, strategy, executor, and risk management.
 """
 
 import asyncio
+import atexit
 import logging
+import queue
+import random
 import sys
+import time
+from enum import IntEnum
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Optional, Callable, Dict, Any
 from pathlib import Path
@@ -23,14 +29,13 @@ from core.websocket import WebSocketManager
 
 logger = logging.getLogger(__name__)
 
-
-class BotState:
-    """Bot state enumeration."""
-    STOPPED = "STOPPED"
-    STARTING = "STARTING"
-    RUNNING = "RUNNING"
-    STOPPING = "STOPPING"
-    ERROR = "ERROR"
+class BotState(IntEnum):
+    """Bot state enumeration (identity-fast comparisons)."""
+    STOPPED = 0
+    STARTING = 1
+    RUNNING = 2
+    STOPPING = 3
+    ERROR = 4
 
 
 class FrontrunBot:
@@ -60,11 +65,24 @@ class FrontrunBot:
         # Runtime
         self._running = False
         self._main_task: Optional[asyncio.Task] = None
+        self._stats_task: Optional[asyncio.Task] = None
+        self._stats_dirty = False
+
+        # Event-driven wakeups (set by WebSocket on book updates)
+        self._book_event = asyncio.Event()
+        self._resume_event = asyncio.Event()
+        self._stop_event = asyncio.Event()
         
         # Statistics
         self.start_time: Optional[datetime] = None
         self.cycles_run = 0
-        
+        self._start_time_mono: Optional[float] = None
+        self._start_time_iso: Optional[str] = None
+
+        # Memoized market list for the UI (rebuilt only when the cache changes)
+        self._markets_snapshot: list = []
+        self._markets_snapshot_version = -1
+
         # UI Callbacks
         self._on_state_change: Optional[Callable] = None
         self._on_log: Optional[Callable] = None
@@ -87,17 +105,20 @@ class FrontrunBot:
         self._on_trade = on_trade
         self._on_stats_update = on_stats_update
     
-    def _set_state(self, new_state: str):
+    def _set_state(self, new_state: BotState):
         """Update bot state and notify UI."""
         self.state = new_state
-        logger.info(f"Bot state: {new_state}")
+        logger.info("Bot state: %s", new_state.name)
         if self._on_state_change:
-            self._on_state_change(new_state)
-    
+            self._on_state_change(new_state.name)
+
     def _log(self, level: str, message: str):
         """Log message and send to UI."""
-        log_func = getattr(logger, level.lower(), logger.info)
-        log_func(message)
+        level_int = getattr(logging, level.upper(), logging.INFO)
+        # Skip entirely when neither the logger nor the UI will see it
+        if not logger.isEnabledFor(level_int) and not self._on_log:
+            return
+        logger.log(level_int, message)
         if self._on_log:
             self._on_log(level, message)
     
@@ -150,12 +171,16 @@ class FrontrunBot:
         # Initialize WebSocket for real-time updates
         if self.settings.websocket_enabled:
             self.websocket = WebSocketManager()
+            # Wake the main loop as soon as a book update arrives
+            self.websocket.set_callbacks(on_orderbook_update=self._on_book_update)
             self._log("INFO", "WebSocket manager initialized")
 
         self.scanner = MarketScanner(self.client, websocket=self.websocket)
         self.executor = OrderExecutor(self.client)
         self.risk_manager = RiskManager(self.settings.bankroll, database=self.database)
-        self.strategy = FrontrunStrategy(self.scanner, self.executor)
+        # Wake a paused main loop as soon as the breaker is reset
+        self.risk_manager.on_breaker_reset = self._resume_event.set
+        self.strategy = FrontrunStrategy(self.scanner, self.executor, self.websocket)
         
         # Wire up callbacks
         self.strategy.set_callbacks(
@@ -166,19 +191,48 @@ class FrontrunBot:
         
         self._log("INFO", "All components initialized")
     
+    def _dispatch(self, callback: Callable, payload):
+        """Schedule a UI callback without blocking the current cycle."""
+        try:
+            asyncio.get_running_loop().call_soon(callback, payload)
+        except RuntimeError:
+            callback(payload)
+
+    async def _stats_pump(self):
+        """Push stats to the UI at most once per 100ms (coalesces updates)."""
+        while self._running:
+            await asyncio.sleep(0.1)
+            if self._stats_dirty and self._on_stats_update:
+                self._stats_dirty = False
+                self._on_stats_update(self.get_stats())
+
+    def _on_book_update(self, update):
+        """Wake the main loop when a real-time book update arrives."""
+        self._book_event.set()
+        # Prices moved: pre-signed orders for this market are stale,
+        # but the fresh top-of-book seeds speculative signing
+        if self.executor:
+            self.executor.invalidate_signed(update.token_id)
+            self.executor.update_book_cache(
+                update.token_id,
+                float(update.bids[0, 0]) if len(update.bids) else None,
+                float(update.asks[0, 0]) if len(update.asks) else None
+            )
+
     def _handle_trade(self, trade_info: Dict):
         """Handle completed trade."""
         if self._on_trade:
-            self._on_trade(trade_info)
-        
-        # Update stats
-        if self._on_stats_update:
-            self._on_stats_update(self.get_stats())
+            self._dispatch(self._on_trade, trade_info)
+
+        # Stats refresh is picked up by the pump
+        self._stats_dirty = True
     
     async def _main_loop(self):
         """Main bot execution loop."""
         self._log("INFO", "Starting main loop...")
-        
+
+        error_backoff = 0.5
+
         while self._running:
             try:
                 # Check if trading allowed
@@ -186,12 +240,19 @@ class FrontrunBot:
                 
                 if not can_trade:
                     self._log("WARNING", f"Trading paused: {reason}")
-                    await asyncio.sleep(30)
+                    # Wake early if trading is resumed (e.g. circuit breaker reset)
+                    try:
+                        await asyncio.wait_for(self._resume_event.wait(), timeout=30)
+                    except asyncio.TimeoutError:
+                        pass
+                    self._resume_event.clear()
                     continue
                 
                 # Run strategy cycle
                 self.cycles_run += 1
-                self._log("DEBUG", f"Running cycle #{self.cycles_run}")
+                # Don't format the cycle message unless DEBUG is emitted
+                if logger.isEnabledFor(logging.DEBUG):
+                    self._log("DEBUG", f"Running cycle #{self.cycles_run}")
                 
                 trade = await self.strategy.run_cycle()
                 
@@ -210,7 +271,7 @@ class FrontrunBot:
                     
                     # Update markets table
                     if self._on_market_update:
-                        self._on_market_update({
+                        self._dispatch(self._on_market_update, {
                             'market_name': trade.get('market_name'),
                             'token_id': trade.get('token_id'),
                             'spread': 0,
@@ -218,25 +279,42 @@ class FrontrunBot:
                             'action': f"{trade.get('side')} (frontrun)",
                             'profit': trade.get('estimated_profit')
                         })
+
+                # Stats are pushed by the pump, coalesced across cycles
+                self._stats_dirty = True
                 
-                # Update stats every cycle (real-time)
-                if self._on_stats_update:
-                    self._on_stats_update(self.get_stats())
-                
-                # Small delay between cycles
-                await asyncio.sleep(1)
-                
+                # Wait for the next book update (event-driven), bounded by
+                # polling_interval so the REST fallback path still cycles
+                try:
+                    await asyncio.wait_for(
+                        self._book_event.wait(),
+                        timeout=self.settings.polling_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                self._book_event.clear()
+
+                error_backoff = 0.5  # Healthy cycle: reset backoff
+
             except asyncio.CancelledError:
                 break
             except Exception as e:
                 self._log("ERROR", f"Loop error: {e}")
-                await asyncio.sleep(5)
+                # Exponential backoff with jitter; stop() wakes us immediately
+                error_backoff = min(30.0, error_backoff * 2)
+                try:
+                    await asyncio.wait_for(
+                        self._stop_event.wait(),
+                        timeout=error_backoff * random.uniform(0.8, 1.2)
+                    )
+                except asyncio.TimeoutError:
+                    pass
         
         self._log("INFO", "Main loop stopped")
     
     async def start(self) -> bool:
         """Start the bot."""
-        if self.state == BotState.RUNNING:
+        if self.state is BotState.RUNNING:
             self._log("WARNING", "Bot is already running")
             return False
         
@@ -263,20 +341,30 @@ class FrontrunBot:
 
         # Start main loop
         self._running = True
+        self._stop_event.clear()
         self.start_time = datetime.now()
+        # Cache monotonic/ISO forms once; get_stats runs every cycle
+        self._start_time_mono = time.monotonic()
+        self._start_time_iso = self.start_time.isoformat()
         self._main_task = asyncio.create_task(self._main_loop())
+        self._stats_task = asyncio.create_task(self._stats_pump())
 
         self._set_state(BotState.RUNNING)
         return True
     
     async def stop(self):
         """Stop the bot gracefully."""
-        if self.state != BotState.RUNNING:
+        if self.state is not BotState.RUNNING:
             return
         
         self._set_state(BotState.STOPPING)
         self._running = False
-        
+
+        # Wake the loop if it is waiting on an event
+        self._stop_event.set()
+        self._book_event.set()
+        self._resume_event.set()
+
         # Cancel pending orders
         if self.executor:
             await self.executor.cancel_all_orders()
@@ -293,21 +381,41 @@ class FrontrunBot:
             except asyncio.CancelledError:
                 pass
 
+        # Stop the stats pump
+        if self._stats_task:
+            self._stats_task.cancel()
+            try:
+                await self._stats_task
+            except asyncio.CancelledError:
+                pass
+
         # Disconnect WebSocket
         if self.websocket:
             await self.websocket.disconnect()
             self._log("INFO", "WebSocket disconnected")
 
+        # Close the scanner's HTTP session
+        if self.scanner:
+            await self.scanner.close()
+
+        # Flush pending trade writes
+        if self.database:
+            await self.database.flush()
+
+        # Release executor threads
+        if self.executor:
+            self.executor.close()
+
         self._set_state(BotState.STOPPED)
         self._log("INFO", "Bot stopped")
     
     def get_stats(self) -> Dict[str, Any]:
         """Get comprehensive bot statistics."""
         stats = {
-            'state': self.state,
-            'start_time': self.start_time.isoformat() if self.start_time else None,
+            'state': self.state.name,
+            'start_time': self._start_time_iso,
             'cycles_run': self.cycles_run,
-            'uptime_seconds': (datetime.now() - self.start_time).total_seconds() if self.start_time else 0
+            'uptime_seconds': time.monotonic() - self._start_time_mono if self._start_time_mono else 0
         }
         
         if self.risk_manager:
@@ -326,12 +434,29 @@ class FrontrunBot:
             stats['cache'] = self.scanner.get_cache_stats()
 
         return stats
-    
+
     def get_cached_markets(self):
-        """Get cached market data for UI."""
-        if self.scanner:
-            return [m.to_dict() for m in self.scanner.get_cached_markets()]
-        return []
+        """Get cached market data for UI (O(1) when the cache is unchanged)."""
+        if not self.scanner:
+            return []
+
+        version = self.scanner.cache_version
+        if version != self._markets_snapshot_version:
+            self._markets_snapshot = [m.to_dict() for m in self.scanner.get_cached_markets()]
+            self._markets_snapshot_version = version
+        return self._markets_snapshot
+
+
+def _install_uvloop():
+    """Install uvloop as the event loop policy if available (2-4x faster)."""
+    if sys.platform == 'win32':
+        return
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("uvloop event loop policy installed")
+    except ImportError:
+        pass
 
 
 def setup_logging(log_file: str = "bot.log", log_level: str = "INFO"):
@@ -353,17 +478,26 @@ def setup_logging(log_file: str = "bot.log", log_level: str = "INFO"):
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(level)
     file_handler.setFormatter(formatter)
-    
+
+    # Route records through a queue so the event loop never blocks on
+    # console/file I/O; a background listener thread does the writing
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(log_queue, console, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+
     # Configure root logger
     root = logging.getLogger()
     root.setLevel(level)
-    root.addHandler(console)
-    root.addHandler(file_handler)
+    root.addHandler(QueueHandler(log_queue))
     
     # Reduce noise from libraries
     logging.getLogger('urllib3').setLevel(logging.WARNING)
     logging.getLogger('httpx').setLevel(logging.WARNING)
 
+    # Faster event loop where available
+    _install_uvloop()
+
 
 # Singleton instance
 _bot_instance: Optional[FrontrunBot] = None
@@ -1,17 +1,19 @@
 """
 Configuration management for Polymarket Frontrun Bot.
-Uses Pydantic for validation and automatic .env loading.
+Pydantic validates and loads .env once; runtime code reads a frozen
+dataclass so hot-path attribute access is plain slot indexing.
 """
 
+from dataclasses import dataclass, fields
 from pathlib import Path
 from typing import Optional
 from pydantic_settings import BaseSettings
 from pydantic import Field, validator
 
 
-class Settings(BaseSettings):
-    """Bot configuration with validation and defaults."""
-    
+class SettingsLoader(BaseSettings):
+    """Validates and loads configuration from .env / environment."""
+
     # Authentication
     private_key: str = Field(
         default="",
@@ -29,7 +31,7 @@ class Settings(BaseSettings):
         default=None,
         description="L2 API passphrase"
     )
-    
+
     # Network
     rpc_url: str = Field(
         default="https://polygon-rpc.com",
@@ -43,7 +45,7 @@ class Settings(BaseSettings):
         default=137,
         description="Polygon chain ID"
     )
-    
+
     # Trading Parameters
     bankroll: float = Field(
         default=100.0,
@@ -73,7 +75,7 @@ class Settings(BaseSettings):
         le=5.0,
         description="Order book polling interval (seconds) - optimized for speed"
     )
-    
+
     # Risk Management
     max_daily_loss_percent: float = Field(
         default=5.0,
@@ -122,30 +124,80 @@ class Settings(BaseSettings):
         default="bot.log",
         description="Log file path"
     )
-    
+
     @validator('private_key')
     def validate_private_key(cls, v):
         """Remove 0x prefix if present."""
         if v and v.startswith('0x'):
             return v[2:]
         return v
-    
-    @property
-    def max_trade_amount(self) -> float:
-        """Calculate max trade amount based on bankroll."""
-        return self.bankroll * (self.max_trade_percent / 100)
-    
-    @property
-    def is_configured(self) -> bool:
-        """Check if essential configuration is set."""
-        return bool(self.private_key and len(self.private_key) == 64)
-    
+
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         case_sensitive = False
 
 
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Immutable runtime settings (attribute access is slot indexing)."""
+
+    # Authentication
+    private_key: str = ""
+    polymarket_api_key: Optional[str] = None
+    polymarket_api_secret: Optional[str] = None
+    polymarket_api_passphrase: Optional[str] = None
+
+    # Network
+    rpc_url: str = "https://polygon-rpc.com"
+    clob_url: str = "https://clob.polymarket.com"
+    chain_id: int = 137
+
+    # Trading Parameters
+    bankroll: float = 100.0
+    max_trade_percent: float = 1.0
+    micro_order_size: int = 3
+    spread_threshold: float = 0.10
+    polling_interval: float = 0.2
+
+    # Risk Management
+    max_daily_loss_percent: float = 5.0
+    max_concurrent_trades: int = 1
+    min_counter_order_size: int = 50
+    reaction_time_threshold: float = 1.0
+
+    # WebSocket Settings
+    websocket_enabled: bool = True
+    ws_market_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/market"
+    ws_user_url: str = "wss://ws-subscriptions-clob.polymarket.com/ws/user"
+
+    # Logging
+    log_level: str = "INFO"
+    log_file: str = "bot.log"
+
+    # Precomputed on build (not properties: no call per access)
+    max_trade_amount: float = 0.0
+    is_configured: bool = False
+
+    _COMPUTED = frozenset({'max_trade_amount', 'is_configured'})
+
+    def model_dump(self) -> dict:
+        """Dump fields as a dict (mirrors the Pydantic API)."""
+        return {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.name not in self._COMPUTED
+        }
+
+
+def _freeze(loader: SettingsLoader) -> Settings:
+    """Build the frozen runtime settings from a validated loader."""
+    values = loader.model_dump()
+    values['max_trade_amount'] = loader.bankroll * (loader.max_trade_percent / 100)
+    values['is_configured'] = bool(loader.private_key and len(loader.private_key) == 64)
+    return Settings(**values)
+
+
 # Global settings instance
 _settings: Optional[Settings] = None
 
@@ -154,15 +206,15 @@ def get_settings() -> Settings:
     """Get or create settings instance."""
     global _settings
     if _settings is None:
-        _settings = Settings()
+        _settings = _freeze(SettingsLoader())
     return _settings
 
 
 def update_settings(**kwargs) -> Settings:
-    """Update settings with new values."""
+    """Update settings with new values (revalidated through the loader)."""
     global _settings
     current = get_settings()
     new_values = current.model_dump()
     new_values.update(kwargs)
-    _settings = Settings(**new_values)
+    _settings = _freeze(SettingsLoader(**new_values))
     return _settings
@@ -3,15 +3,21 @@ SQLite Database for Polymarket Frontrun Bot.
 Persists trades and daily stats for analysis and recovery.
 """
 
+import asyncio
 import sqlite3
 import logging
-from datetime import datetime, date
+import threading
+from datetime import datetime, date, timezone
 from typing import List, Optional
 from pathlib import Path
 from dataclasses import asdict
 
 logger = logging.getLogger(__name__)
 
+# Timestamps are stored as INTEGER microseconds since epoch: 8 bytes per
+# row instead of a ~27-byte ISO string, and integer index comparisons
+sqlite3.register_adapter(datetime, lambda dt: int(dt.timestamp() * 1_000_000))
+
 
 class Database:
     """
@@ -21,38 +27,105 @@ class Database:
     - Trade history persistence
     - Daily stats aggregation
     - Automatic table creation
-    - Thread-safe connections
+    - Single persistent WAL connection (no per-query connect cost)
+    - Batched writes via async queue (keeps disk I/O off the hot path)
+    """
+
+    FLUSH_BATCH_SIZE = 64
+    FLUSH_INTERVAL = 0.1  # Seconds to wait for more trades before flushing
+
+    # Hot-path SQL as constants so SQLite's statement cache reuses the
+    # prepared statements across calls (same text = same cache entry)
+    _SQL_INSERT_TRADE = """
+        INSERT INTO trades (timestamp, market, side, size, entry_price, exit_price, pnl)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    _SQL_STATS_UPSERT = """
+        INSERT INTO daily_stats (date, trades, wins, losses, gross_profit, gross_loss)
+        VALUES (?, 1, ?, ?, ?, ?)
+        ON CONFLICT(date) DO UPDATE SET
+            trades = trades + 1,
+            wins = wins + excluded.wins,
+            losses = losses + excluded.losses,
+            gross_profit = gross_profit + excluded.gross_profit,
+            gross_loss = gross_loss + excluded.gross_loss,
+            updated_at = CURRENT_TIMESTAMP
     """
 
     def __init__(self, db_path: str = "trades.db"):
         self.db_path = Path(db_path)
+
+        # One persistent connection shared across threads, guarded by a lock.
+        # WAL mode + synchronous=NORMAL cuts fsync cost on the write path.
+        self._conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None  # Autocommit; transactions are explicit
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+        """)
+        self._lock = threading.Lock()
+
+        # Separate read-only connection: with WAL, readers run concurrently
+        # with the writer, so UI stat queries never block trade writes
+        self._read_conn = sqlite3.connect(
+            str(self.db_path),
+            check_same_thread=False,
+            isolation_level=None
+        )
+        self._read_conn.row_factory = sqlite3.Row
+        self._read_conn.execute("PRAGMA query_only=1")
+        self._read_lock = threading.Lock()
+
+        # Memoized all-time aggregates, maintained incrementally on writes
+        self._alltime_cache: Optional[dict] = None
+
+        # Async write batching (active when created inside a running loop)
+        self._trade_queue: Optional[asyncio.Queue] = None
+        self._flusher: Optional[asyncio.Task] = None
+        try:
+            loop = asyncio.get_running_loop()
+            self._trade_queue = asyncio.Queue()
+            self._flusher = loop.create_task(self._flush_loop())
+        except RuntimeError:
+            pass  # No event loop: save_trade writes synchronously
+
         self._init_tables()
         logger.info(f"Database initialized: {self.db_path}")
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a new connection (thread-safe pattern)."""
-        conn = sqlite3.connect(str(self.db_path))
-        conn.row_factory = sqlite3.Row
-        return conn
+    # day is denormalized from the integer timestamp so date queries hit
+    # an index instead of computing date() over every row. It is a UTC day
+    # (SQLite forbids 'localtime' in generated columns), so every date
+    # written or queried against this schema must also be UTC.
+    _SQL_CREATE_TRADES = """
+        CREATE TABLE IF NOT EXISTS trades (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            timestamp INTEGER NOT NULL,
+            market TEXT NOT NULL,
+            side TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            entry_price REAL NOT NULL,
+            exit_price REAL NOT NULL,
+            pnl REAL NOT NULL,
+            created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+            day TEXT GENERATED ALWAYS AS (date(timestamp / 1000000, 'unixepoch')) VIRTUAL
+        );
+    """
 
     def _init_tables(self):
-        """Create tables if they don't exist."""
-        with self._get_connection() as conn:
-            conn.executescript("""
-                CREATE TABLE IF NOT EXISTS trades (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    market TEXT NOT NULL,
-                    side TEXT NOT NULL,
-                    size INTEGER NOT NULL,
-                    entry_price REAL NOT NULL,
-                    exit_price REAL NOT NULL,
-                    pnl REAL NOT NULL,
-                    created_at TEXT DEFAULT CURRENT_TIMESTAMP
-                );
+        """Create tables if they don't exist (migrating old text timestamps)."""
+        with self._lock:
+            self._migrate_text_timestamps()
 
+            self._conn.executescript(self._SQL_CREATE_TRADES + """
                 CREATE INDEX IF NOT EXISTS idx_trades_timestamp ON trades(timestamp);
                 CREATE INDEX IF NOT EXISTS idx_trades_market ON trades(market);
+                CREATE INDEX IF NOT EXISTS idx_trades_day ON trades(day);
 
                 CREATE TABLE IF NOT EXISTS daily_stats (
                     date TEXT PRIMARY KEY,
@@ -64,66 +137,165 @@ class Database:
                     updated_at TEXT DEFAULT CURRENT_TIMESTAMP
                 );
             """)
-            conn.commit()
+
+    def _migrate_text_timestamps(self):
+        """Rebuild trades tables created before the INTEGER timestamp schema."""
+        row = self._conn.execute(
+            "SELECT type FROM pragma_table_info('trades') WHERE name = 'timestamp'"
+        ).fetchone()
+        if row is None or row['type'] == 'INTEGER':
+            return
+
+        logger.info("Migrating trades table to integer timestamps...")
+        try:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute(
+                self._SQL_CREATE_TRADES.replace(
+                    "CREATE TABLE IF NOT EXISTS trades",
+                    "CREATE TABLE trades_new"
+                )
+            )
+            # Second precision is enough for pre-migration history
+            self._conn.execute("""
+                INSERT INTO trades_new (id, timestamp, market, side, size,
+                                        entry_price, exit_price, pnl, created_at)
+                SELECT id, CAST(strftime('%s', timestamp, 'utc') AS INTEGER) * 1000000,
+                       market, side, size, entry_price, exit_price, pnl, created_at
+                FROM trades
+            """)
+            self._conn.execute("DROP TABLE trades")
+            self._conn.execute("ALTER TABLE trades_new RENAME TO trades")
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
 
     def save_trade(self, trade) -> int:
         """
         Save a trade record to the database.
 
+        When a flusher task is running, the trade is queued and written in
+        the next batch (amortizing fsync cost); otherwise it is written
+        synchronously.
+
         Args:
             trade: TradeRecord dataclass
 
         Returns:
-            ID of the inserted trade
+            ID of the inserted trade, or -1 if the write was queued
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute("""
-                INSERT INTO trades (timestamp, market, side, size, entry_price, exit_price, pnl)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-            """, (
-                trade.timestamp.isoformat(),
-                trade.market,
-                trade.side,
-                trade.size,
-                trade.entry_price,
-                trade.exit_price,
-                trade.pnl
-            ))
-            conn.commit()
-
-            # Update daily stats
-            self._update_daily_stats(conn, trade)
+        if self._trade_queue is not None:
+            self._trade_queue.put_nowait(trade)
+            return -1
+        return self._write_trade(trade)
+
+    def _write_trade(self, trade) -> int:
+        """Write a single trade (insert + daily stats in one transaction)."""
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                cursor = self._conn.execute(self._SQL_INSERT_TRADE, (
+                    trade.timestamp,
+                    trade.market,
+                    trade.side,
+                    trade.size,
+                    trade.entry_price,
+                    trade.exit_price,
+                    trade.pnl
+                ))
+
+                # Update daily stats in the same transaction
+                self._update_daily_stats(self._conn, trade)
+
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
 
             logger.debug(f"Trade saved: ID={cursor.lastrowid}, PnL=${trade.pnl:.2f}")
+            self._update_alltime_cache([trade])
             return cursor.lastrowid
 
+    def _write_batch(self, trades: List):
+        """Write a batch of trades in a single transaction."""
+        if not trades:
+            return
+
+        with self._lock:
+            try:
+                self._conn.execute("BEGIN IMMEDIATE")
+                self._conn.executemany(self._SQL_INSERT_TRADE, [
+                    (t.timestamp, t.market, t.side, t.size,
+                     t.entry_price, t.exit_price, t.pnl)
+                    for t in trades
+                ])
+                self._update_daily_stats_batch(self._conn, trades)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+            self._update_alltime_cache(trades)
+
+        logger.debug(f"Flushed {len(trades)} trades to database")
+
+    async def _flush_loop(self):
+        """Drain queued trades in batches (one fsync per batch)."""
+        while True:
+            batch = []
+            try:
+                batch.append(await self._trade_queue.get())
+                try:
+                    while len(batch) < self.FLUSH_BATCH_SIZE:
+                        batch.append(await asyncio.wait_for(
+                            self._trade_queue.get(),
+                            timeout=self.FLUSH_INTERVAL
+                        ))
+                except asyncio.TimeoutError:
+                    pass
+                self._write_batch(batch)
+            except asyncio.CancelledError:
+                # Don't lose trades collected in this iteration
+                self._write_batch(batch)
+                self._drain_queue()
+                raise
+            except Exception as e:
+                logger.error(f"Trade flush error: {e}")
+
+    def _drain_queue(self):
+        """Synchronously write anything still queued."""
+        if self._trade_queue is None:
+            return
+        batch = []
+        while not self._trade_queue.empty():
+            batch.append(self._trade_queue.get_nowait())
+        self._write_batch(batch)
+
+    async def flush(self):
+        """Flush all pending trade writes to disk."""
+        self._drain_queue()
+
+    @staticmethod
+    def _stats_params(trade) -> tuple:
+        """Build (date, win, loss, gross_profit, gross_loss) for the upsert."""
+        win = 1 if trade.pnl >= 0 else 0
+        loss = 1 - win
+        # UTC date to match the trades.day generated column
+        return (
+            trade.timestamp.astimezone(timezone.utc).date().isoformat(),
+            win,
+            loss,
+            trade.pnl if win else 0.0,
+            0.0 if win else -trade.pnl
+        )
+
     def _update_daily_stats(self, conn: sqlite3.Connection, trade):
-        """Update daily stats atomically."""
-        trade_date = trade.timestamp.date().isoformat()
-
-        # Upsert daily stats
-        if trade.pnl >= 0:
-            conn.execute("""
-                INSERT INTO daily_stats (date, trades, wins, gross_profit)
-                VALUES (?, 1, 1, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    trades = trades + 1,
-                    wins = wins + 1,
-                    gross_profit = gross_profit + ?,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (trade_date, trade.pnl, trade.pnl))
-        else:
-            conn.execute("""
-                INSERT INTO daily_stats (date, trades, losses, gross_loss)
-                VALUES (?, 1, 1, ?)
-                ON CONFLICT(date) DO UPDATE SET
-                    trades = trades + 1,
-                    losses = losses + 1,
-                    gross_loss = gross_loss + ?,
-                    updated_at = CURRENT_TIMESTAMP
-            """, (trade_date, abs(trade.pnl), abs(trade.pnl)))
-
-        conn.commit()
+        """Update daily stats (caller owns the transaction)."""
+        conn.execute(self._SQL_STATS_UPSERT, self._stats_params(trade))
+
+    def _update_daily_stats_batch(self, conn: sqlite3.Connection, trades: List):
+        """Batch daily-stats upserts through a single executemany."""
+        conn.executemany(self._SQL_STATS_UPSERT, [self._stats_params(t) for t in trades])
 
     def get_trades(self, limit: int = 100, offset: int = 0) -> List[dict]:
         """
@@ -136,8 +308,8 @@ class Database:
         Returns:
             List of trade dictionaries
         """
-        with self._get_connection() as conn:
-            cursor = conn.execute("""
+        with self._read_lock:
+            cursor = self._read_conn.execute("""
                 SELECT * FROM trades
                 ORDER BY timestamp DESC
                 LIMIT ? OFFSET ?
@@ -146,11 +318,11 @@ class Database:
             return [dict(row) for row in cursor.fetchall()]
 
     def get_trades_by_date(self, target_date: date) -> List[dict]:
-        """Get all trades for a specific date."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("""
+        """Get all trades for a specific date (UTC day)."""
+        with self._read_lock:
+            cursor = self._read_conn.execute("""
                 SELECT * FROM trades
-                WHERE date(timestamp) = ?
+                WHERE day = ?
                 ORDER BY timestamp DESC
             """, (target_date.isoformat(),))
 
@@ -161,32 +333,53 @@ class Database:
         Get daily statistics.
 
         Args:
-            target_date: Date to get stats for (defaults to today)
+            target_date: Date to get stats for (defaults to today, UTC)
 
         Returns:
             Dictionary with daily stats or None
         """
         if target_date is None:
-            target_date = date.today()
+            target_date = datetime.now(timezone.utc).date()
 
-        with self._get_connection() as conn:
-            cursor = conn.execute("""
+        with self._read_lock:
+            cursor = self._read_conn.execute("""
                 SELECT * FROM daily_stats WHERE date = ?
             """, (target_date.isoformat(),))
 
             row = cursor.fetchone()
-            if row:
-                stats = dict(row)
-                stats['net_pnl'] = stats['gross_profit'] - stats['gross_loss']
-                stats['win_rate'] = stats['wins'] / stats['trades'] if stats['trades'] > 0 else 0
-                return stats
 
-            return None
+        if row:
+            stats = dict(row)
+            stats['net_pnl'] = stats['gross_profit'] - stats['gross_loss']
+            stats['win_rate'] = stats['wins'] / stats['trades'] if stats['trades'] > 0 else 0
+            return stats
+
+        return None
+
+    def _update_alltime_cache(self, trades: List):
+        """Fold freshly written trades into the memoized all-time stats."""
+        if self._alltime_cache is None:
+            return
+
+        stats = self._alltime_cache
+        for trade in trades:
+            stats['total_trades'] += 1
+            if trade.pnl >= 0:
+                stats['wins'] += 1
+                stats['gross_profit'] += trade.pnl
+            else:
+                stats['losses'] += 1
+                stats['gross_loss'] += -trade.pnl
+            stats['net_pnl'] += trade.pnl
+        stats['win_rate'] = stats['wins'] / stats['total_trades']
 
     def get_all_time_stats(self) -> dict:
-        """Get aggregated all-time statistics."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("""
+        """Get aggregated all-time statistics (O(1) after the first call)."""
+        if self._alltime_cache is not None:
+            return dict(self._alltime_cache)
+
+        with self._read_lock:
+            cursor = self._read_conn.execute("""
                 SELECT
                     COUNT(*) as total_trades,
                     SUM(CASE WHEN pnl >= 0 THEN 1 ELSE 0 END) as wins,
@@ -198,12 +391,12 @@ class Database:
             """)
 
             row = cursor.fetchone()
-            if row:
-                stats = dict(row)
-                stats['win_rate'] = stats['wins'] / stats['total_trades'] if stats['total_trades'] > 0 else 0
-                return stats
 
-            return {
+        if row and row['total_trades'] > 0:
+            stats = dict(row)
+            stats['win_rate'] = stats['wins'] / stats['total_trades']
+        else:
+            stats = {
                 'total_trades': 0,
                 'wins': 0,
                 'losses': 0,
@@ -213,18 +406,33 @@ class Database:
                 'win_rate': 0.0
             }
 
+        self._alltime_cache = stats
+        return dict(stats)
+
     def load_trade_history(self, limit: int = 1000) -> List[dict]:
         """Load trade history for RiskManager initialization."""
         return self.get_trades(limit=limit)
 
     def get_trade_count(self) -> int:
         """Get total number of trades."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM trades")
+        with self._read_lock:
+            cursor = self._read_conn.execute("SELECT COUNT(*) FROM trades")
             return cursor.fetchone()[0]
 
     def vacuum(self):
         """Optimize database file size."""
-        with self._get_connection() as conn:
-            conn.execute("VACUUM")
+        with self._lock:
+            self._conn.execute("VACUUM")
         logger.info("Database vacuumed")
+
+    def close(self):
+        """Flush pending writes and close the persistent connection."""
+        if self._flusher:
+            self._flusher.cancel()
+            self._flusher = None
+        self._drain_queue()
+        with self._read_lock:
+            self._read_conn.close()
+        with self._lock:
+            self._conn.close()
+        logger.info("Database connection closed")
@@ -4,9 +4,13 @@ Handles order placement, cancellation, and execution via py-clob-client.
 """
 
 import asyncio
+import functools
 import logging
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from typing import Optional, Dict, Any
-from datetime import datetime
 
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderArgs, OrderType
@@ -17,6 +21,17 @@ from config.settings import get_settings
 logger = logging.getLogger(__name__)
 
 
+@dataclass(slots=True)
+class ActiveOrder:
+    """A tracked order on the CLOB."""
+    token_id: str
+    side: str
+    price: float
+    size: int
+    placed_at: float
+    status: str
+
+
 class OrderExecutor:
     """
     Executes orders on Polymarket CLOB.
@@ -30,15 +45,39 @@ class OrderExecutor:
     """
 
     MAX_RETRIES = 3
-    RETRY_DELAYS = [0.5, 1.0, 2.0]  # Exponential backoff
+    BASE_DELAY = 0.5  # First retry delay in seconds
+    MAX_BACKOFF = 2.0  # Backoff ceiling in seconds
     API_TIMEOUT = 10.0  # Timeout for API calls in seconds
+    POOL_SIZE = 64  # Dedicated threads for sync CLOB calls
+    SPECULATIVE_TOLERANCE = 0.002  # Max drift before a speculative sign is discarded
+    BOOK_CACHE_TTL = 0.1  # Max age of a WebSocket book before falling back to REST
+
+    # Errors that retrying can never fix (bad arguments on our side)
+    NON_RETRIABLE = (ValueError, TypeError, KeyError)
 
     def __init__(self, client: ClobClient):
         self.client = client
         self.settings = get_settings()
 
-        # Track active orders
-        self._active_orders: Dict[str, Dict[str, Any]] = {}
+        # Own bounded pool so bursty order I/O doesn't queue behind the
+        # small default to_thread executor (or unrelated callers)
+        self._pool = ThreadPoolExecutor(
+            max_workers=self.POOL_SIZE,
+            thread_name_prefix="clob-io"
+        )
+
+        # Track active orders; the id set keeps the open subset O(1)
+        # instead of rescanning every tracked order
+        self._active_orders: Dict[str, ActiveOrder] = {}
+        self._open_order_ids: set = set()
+
+        # Pre-signed orders keyed by (token_id, side, size, price):
+        # EIP-712 signing is CPU-heavy, so it can be done off the hot path
+        self._signed_cache: Dict[tuple, Any] = {}
+
+        # Last known top-of-book per token, fed by WebSocket updates:
+        # token_id -> (best_bid, best_ask, monotonic_ts)
+        self._last_book_cache: Dict[str, tuple] = {}
 
         # Execution stats
         self.orders_placed = 0
@@ -48,15 +87,99 @@ class OrderExecutor:
         self.total_volume = 0.0
 
     async def _run_with_timeout(self, func, *args, **kwargs):
-        """Run a sync function in thread with timeout protection."""
+        """Run a sync function in the CLOB pool with timeout protection."""
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self._pool, functools.partial(func, *args, **kwargs))
         try:
-            return await asyncio.wait_for(
-                asyncio.to_thread(func, *args, **kwargs),
-                timeout=self.API_TIMEOUT
-            )
+            return await asyncio.wait_for(future, timeout=self.API_TIMEOUT)
         except asyncio.TimeoutError:
             raise TimeoutError(f"API call timed out after {self.API_TIMEOUT}s")
 
+    def close(self):
+        """Shut down the CLOB I/O thread pool."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    async def prewarm(self, token_id: str, side: str, size: int, price_ticks: list):
+        """
+        Pre-sign orders at candidate price ticks during idle time.
+
+        A later place_limit_order matching (token_id, side, size, price)
+        skips create_order entirely and goes straight to post_order.
+        """
+        order_side = BUY if side == 'BUY' else SELL
+
+        async def sign(price: float):
+            order_args = OrderArgs(
+                token_id=token_id,
+                price=price,
+                size=size,
+                side=order_side,
+                fee_rate_bps=0
+            )
+            try:
+                signed = await self._run_with_timeout(self.client.create_order, order_args)
+                self._signed_cache[(token_id, side, size, round(price, 4))] = signed
+            except Exception as e:
+                logger.debug(f"Prewarm signing failed for {token_id} @ {price}: {e}")
+
+        await asyncio.gather(*(sign(p) for p in price_ticks))
+
+    def update_book_cache(self, token_id: str, best_bid: Optional[float], best_ask: Optional[float]):
+        """Record the latest top-of-book for a token (WebSocket-fed)."""
+        self._last_book_cache[token_id] = (best_bid, best_ask, time.monotonic())
+
+    def invalidate_signed(self, token_id: str):
+        """Drop pre-signed orders for a market (call on book changes)."""
+        stale = [key for key in self._signed_cache if key[0] == token_id]
+        for key in stale:
+            del self._signed_cache[key]
+
+    @classmethod
+    def _is_retriable(cls, error: Exception) -> bool:
+        """
+        Decide whether an error is worth retrying.
+
+        Timeouts, connection drops, 429s and 5xx responses are transient;
+        validation errors and other 4xx responses will fail identically on
+        every attempt, so retrying them just burns the backoff budget.
+        """
+        if isinstance(error, cls.NON_RETRIABLE):
+            return False
+        status = getattr(error, 'status_code', None)
+        if status is not None:
+            return status == 429 or status >= 500
+        return True
+
+    @staticmethod
+    async def _run_bounded(coros, limit: int = 16) -> list:
+        """
+        Run coroutines with at most `limit` in flight at once.
+
+        A new coroutine starts the moment one finishes, so the window
+        stays full instead of draining in lock-step batches. Exceptions
+        are returned in place of results; completion order is not
+        preserved.
+        """
+        results = []
+        pending = set()
+        iterator = iter(coros)
+
+        def _fill():
+            while len(pending) < limit:
+                try:
+                    pending.add(asyncio.ensure_future(next(iterator)))
+                except StopIteration:
+                    break
+
+        _fill()
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                exc = task.exception()
+                results.append(exc if exc is not None else task.result())
+            _fill()
+        return results
+
     async def _retry_with_backoff(self, func, *args, **kwargs):
         """Execute function with retry and exponential backoff."""
         last_error = None
@@ -68,9 +191,15 @@ class OrderExecutor:
                     return await self._run_with_timeout(func, *args, **kwargs)
             except Exception as e:
                 last_error = e
+                if not self._is_retriable(e):
+                    logger.debug(f"Non-retriable error, failing fast: {e}")
+                    raise
                 if attempt < self.MAX_RETRIES - 1:
-                    delay = self.RETRY_DELAYS[attempt]
-                    logger.warning(f"Retry {attempt + 1}/{self.MAX_RETRIES} after {delay}s: {e}")
+                    # Jittered exponential backoff so concurrent retries
+                    # don't hammer the API in lock-step
+                    ceiling = min(self.MAX_BACKOFF, self.BASE_DELAY * (2 ** attempt))
+                    delay = random.uniform(self.BASE_DELAY, ceiling) if ceiling > self.BASE_DELAY else ceiling
+                    logger.warning("Retry %d/%d after %.2fs: %s", attempt + 1, self.MAX_RETRIES, delay, e)
                     self.orders_retried += 1
                     await asyncio.sleep(delay)
         raise last_error
@@ -97,27 +226,33 @@ class OrderExecutor:
             Order ID if successful, None otherwise
         """
         try:
-            # Validate inputs
-            if side not in ('BUY', 'SELL'):
+            # Single combined validity check for the numeric fields
+            if not (0.0 < price < 1.0 and size >= 1):
+                raise ValueError(f"Invalid order: price={price} size={size}")
+
+            if side == 'BUY':
+                order_side = BUY
+            elif side == 'SELL':
+                order_side = SELL
+            else:
                 raise ValueError(f"Invalid side: {side}")
-            if not 0 < price < 1:
-                raise ValueError(f"Invalid price: {price}")
-            if size < 1:
-                raise ValueError(f"Invalid size: {size}")
-            
-            order_side = BUY if side == 'BUY' else SELL
-            
-            # Build order arguments
-            order_args = OrderArgs(
-                token_id=token_id,
-                price=price,
-                size=size,
-                side=order_side,
-                fee_rate_bps=0  # Maker orders have no fee
-            )
-            
-            # Create and sign order (with timeout protection)
-            signed_order = await self._run_with_timeout(self.client.create_order, order_args)
+
+            # Use a pre-signed order if one matches (signing off hot path);
+            # pop because a signed order can only be posted once
+            signed_order = self._signed_cache.pop((token_id, side, size, round(price, 4)), None)
+
+            if signed_order is None:
+                # Build order arguments
+                order_args = OrderArgs(
+                    token_id=token_id,
+                    price=price,
+                    size=size,
+                    side=order_side,
+                    fee_rate_bps=0  # Maker orders have no fee
+                )
+
+                # Create and sign order (with timeout protection)
+                signed_order = await self._run_with_timeout(self.client.create_order, order_args)
 
             # Submit order (with timeout protection)
             response = await self._run_with_timeout(self.client.post_order, signed_order, OrderType.GTC)
@@ -125,27 +260,49 @@ class OrderExecutor:
             if response and response.get('orderID'):
                 order_id = response['orderID']
                 
-                self._active_orders[order_id] = {
-                    'token_id': token_id,
-                    'side': side,
-                    'price': price,
-                    'size': size,
-                    'placed_at': datetime.now(),
-                    'status': 'OPEN'
-                }
+                self._active_orders[order_id] = ActiveOrder(
+                    token_id=token_id,
+                    side=side,
+                    price=price,
+                    size=size,
+                    placed_at=time.monotonic(),
+                    status='OPEN'
+                )
+                self._open_order_ids.add(order_id)
                 
                 self.orders_placed += 1
-                logger.info(f"Limit order placed: {side} {size} @ ${price:.4f} (ID: {order_id})")
+                logger.info("Limit order placed: %s %d @ $%.4f (ID: %s)", side, size, price, order_id)
                 
                 return order_id
             
-            logger.error(f"Order placement failed: {response}")
+            logger.error("Order placement failed: %s", response)
             return None
-            
+
         except Exception as e:
-            logger.error(f"Error placing limit order: {e}")
+            logger.error("Error placing limit order: %s", e)
             return None
     
+    async def place_limit_orders(self, orders: list) -> list:
+        """
+        Place a batch of limit orders concurrently.
+
+        Orders are signed and posted in parallel on the CLOB pool, so a
+        multi-order quote refresh costs roughly one round-trip instead of
+        one per order.
+
+        Args:
+            orders: List of dicts with token_id/side/price/size keys
+                    (same arguments as place_limit_order)
+
+        Returns:
+            List of order IDs (None for failed placements), in input order
+        """
+        tasks = []
+        async with asyncio.TaskGroup() as tg:
+            for order in orders:
+                tasks.append(tg.create_task(self.place_limit_order(**order)))
+        return [task.result() for task in tasks]
+
     async def execute_market_order(
         self,
         token_id: str,
@@ -167,25 +324,65 @@ class OrderExecutor:
             True if order was placed successfully
         """
         try:
-            # Get current order book (with timeout protection)
-            book = await self._run_with_timeout(self.client.get_order_book, token_id)
-            
-            if side == 'BUY':
-                # Buy at best ask (or slightly higher for certainty)
-                if not book.asks:
-                    logger.error("No asks available for market buy")
-                    return False
-                price = float(book.asks[0].price) + 0.001
+            cached = self._last_book_cache.get(token_id)
+
+            if cached is not None and time.monotonic() - cached[2] <= self.BOOK_CACHE_TTL:
+                # Fresh WebSocket book: price directly off it, no REST fetch
+                best_bid, best_ask, _ = cached
+                if side == 'BUY':
+                    if best_ask is None:
+                        logger.error("No asks available for market buy")
+                        return False
+                    price = best_ask + 0.001
+                else:
+                    if best_bid is None:
+                        logger.error("No bids available for market sell")
+                        return False
+                    price = best_bid - 0.001
+                price = max(0.001, min(0.999, price))
             else:
-                # Sell at best bid (or slightly lower)
-                if not book.bids:
-                    logger.error("No bids available for market sell")
-                    return False
-                price = float(book.bids[0].price) - 0.001
-            
-            # Clamp price to valid range
-            price = max(0.001, min(0.999, price))
-            
+                # Stale or missing: speculatively sign at the last known
+                # price while the authoritative REST fetch is in flight;
+                # if the top of book has not moved past tolerance, the
+                # pre-signed order ships directly
+                spec_price = None
+                spec_task = None
+                if cached is not None:
+                    best_bid, best_ask, _ = cached
+                    if side == 'BUY' and best_ask is not None:
+                        spec_price = max(0.001, min(0.999, best_ask + 0.001))
+                    elif side == 'SELL' and best_bid is not None:
+                        spec_price = max(0.001, min(0.999, best_bid - 0.001))
+                    if spec_price is not None:
+                        spec_task = asyncio.ensure_future(
+                            self.prewarm(token_id, side, size, [spec_price])
+                        )
+
+                # Get current order book (with timeout protection)
+                book = await self._run_with_timeout(self.client.get_order_book, token_id)
+
+                if side == 'BUY':
+                    # Buy at best ask (or slightly higher for certainty)
+                    if not book.asks:
+                        logger.error("No asks available for market buy")
+                        return False
+                    price = float(book.asks[0].price) + 0.001
+                else:
+                    # Sell at best bid (or slightly lower)
+                    if not book.bids:
+                        logger.error("No bids available for market sell")
+                        return False
+                    price = float(book.bids[0].price) - 0.001
+
+                # Clamp price to valid range
+                price = max(0.001, min(0.999, price))
+
+                if spec_task is not None:
+                    await spec_task
+                    if spec_price is not None and abs(price - spec_price) <= self.SPECULATIVE_TOLERANCE:
+                        # Close enough: use the already-signed order
+                        price = spec_price
+
             order_id = await self.place_limit_order(
                 token_id=token_id,
                 side=side,
@@ -200,15 +397,16 @@ class OrderExecutor:
                 
                 # Update order status
                 if order_id in self._active_orders:
-                    self._active_orders[order_id]['status'] = 'FILLED'
+                    self._active_orders[order_id].status = 'FILLED'
+                    self._open_order_ids.discard(order_id)
                 
-                logger.info(f"Market order executed: {side} {size} @ ${price:.4f}")
+                logger.info("Market order executed: %s %d @ $%.4f", side, size, price)
                 return True
-            
+
             return False
-            
+
         except Exception as e:
-            logger.error(f"Error executing market order: {e}")
+            logger.error("Error executing market order: %s", e)
             return False
     
     async def cancel_order(self, order_id: str) -> bool:
@@ -226,32 +424,40 @@ class OrderExecutor:
 
             if response:
                 if order_id in self._active_orders:
-                    self._active_orders[order_id]['status'] = 'CANCELLED'
+                    self._active_orders[order_id].status = 'CANCELLED'
+                    self._open_order_ids.discard(order_id)
                 
                 self.orders_cancelled += 1
-                logger.info(f"Order cancelled: {order_id}")
+                logger.info("Order cancelled: %s", order_id)
                 return True
-            
+
             return False
-            
+
         except Exception as e:
-            logger.error(f"Error cancelling order {order_id}: {e}")
+            logger.error("Error cancelling order %s: %s", order_id, e)
             return False
     
     async def cancel_all_orders(self) -> int:
         """
-        Cancel all active orders.
-        
+        Cancel all active orders concurrently.
+
+        All cancels are dispatched at once (bounded fan-out), so a
+        book-wide flatten costs one round-trip instead of one per order.
+
         Returns:
             Number of orders cancelled
         """
-        cancelled = 0
-        
-        for order_id, order in list(self._active_orders.items()):
-            if order['status'] == 'OPEN':
-                if await self.cancel_order(order_id):
-                    cancelled += 1
-        
+        open_ids = list(self._open_order_ids)
+
+        if not open_ids:
+            return 0
+
+        # Bound fan-out to stay under the CLOB cancel rate limit
+        results = await self._run_bounded(
+            (self.cancel_order(oid) for oid in open_ids), limit=32
+        )
+        cancelled = sum(1 for r in results if r is True)
+
         logger.info(f"Cancelled {cancelled} orders")
         return cancelled
     
@@ -270,7 +476,9 @@ class OrderExecutor:
                 
                 # Update local cache
                 if order_id in self._active_orders:
-                    self._active_orders[order_id]['status'] = status['status']
+                    self._active_orders[order_id].status = status['status']
+                    if status['status'] != 'OPEN':
+                        self._open_order_ids.discard(order_id)
                 
                 return status
             
@@ -280,12 +488,23 @@ class OrderExecutor:
             logger.error(f"Error getting order status: {e}")
             return None
     
-    def get_active_orders(self) -> Dict[str, Dict]:
+    async def refresh_open_orders(self) -> int:
+        """
+        Refresh the status of every open order from the exchange.
+
+        Returns:
+            Number of orders polled
+        """
+        open_ids = list(self._open_order_ids)
+        if not open_ids:
+            return 0
+
+        await self._run_bounded(self.get_order_status(oid) for oid in open_ids)
+        return len(open_ids)
+
+    def get_active_orders(self) -> Dict[str, ActiveOrder]:
         """Get all active (open) orders."""
-        return {
-            oid: order for oid, order in self._active_orders.items()
-            if order['status'] == 'OPEN'
-        }
+        return {oid: self._active_orders[oid] for oid in self._open_order_ids}
     
     def get_stats(self) -> Dict:
         """Get execution statistics."""
@@ -295,5 +514,5 @@ class OrderExecutor:
             'orders_cancelled': self.orders_cancelled,
             'orders_retried': self.orders_retried,
             'total_volume': self.total_volume,
-            'active_orders': len(self.get_active_orders())
+            'active_orders': len(self._open_order_ids)
         }
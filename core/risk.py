@@ -4,11 +4,15 @@ Implements position sizing, loss limits, and circuit breakers.
 """
 
 import logging
+import time
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, date
-from typing import Dict, List, Optional, TYPE_CHECKING
+from typing import Callable, Dict, Optional, TYPE_CHECKING
 from enum import Enum
 
+import numpy as np
+
 from config.settings import get_settings
 
 if TYPE_CHECKING:
@@ -25,7 +29,7 @@ class RiskLevel(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeRecord:
     """Record of a completed trade."""
     timestamp: datetime
@@ -41,7 +45,7 @@ class TradeRecord:
         return self.pnl > 0
 
 
-@dataclass
+@dataclass(slots=True)
 class DailyStats:
     """Daily trading statistics."""
     date: date = field(default_factory=date.today)
@@ -62,6 +66,45 @@ class DailyStats:
         return self.wins / self.trades
 
 
+class _TradeArrays:
+    """
+    Structure-of-arrays store for closed trades.
+
+    Parallel NumPy arrays (pnl/timestamp/size) replace a list of
+    TradeRecord objects, so aggregate analytics run as vectorized C
+    loops instead of Python attribute access per record.
+    """
+
+    INITIAL_CAPACITY = 256
+
+    def __init__(self):
+        self._capacity = self.INITIAL_CAPACITY
+        self.pnl = np.empty(self._capacity, dtype=np.float64)
+        self.ts = np.empty(self._capacity, dtype=np.int64)
+        self.size = np.empty(self._capacity, dtype=np.int32)
+        self.n = 0
+
+    def __len__(self) -> int:
+        return self.n
+
+    def append(self, trade: TradeRecord):
+        """Append one closed trade, doubling capacity when full."""
+        if self.n == self._capacity:
+            self._grow()
+        self.pnl[self.n] = trade.pnl
+        self.ts[self.n] = int(trade.timestamp.timestamp())
+        self.size[self.n] = trade.size
+        self.n += 1
+
+    def _grow(self):
+        self._capacity *= 2
+        for name in ('pnl', 'ts', 'size'):
+            old = getattr(self, name)
+            new = np.empty(self._capacity, dtype=old.dtype)
+            new[:self.n] = old[:self.n]
+            setattr(self, name, new)
+
+
 class RiskManager:
     """
     Manages trading risk and position sizing.
@@ -72,7 +115,9 @@ class RiskManager:
     - Concurrent trade limits
     - PnL tracking
     """
-    
+
+    TRADE_HISTORY_SIZE = 10000  # Recent TradeRecords kept for review
+
     def __init__(self, initial_bankroll: Optional[float] = None, database: Optional['Database'] = None):
         self.settings = get_settings()
 
@@ -83,9 +128,17 @@ class RiskManager:
         # Database persistence
         self._database = database
 
-        # Trade tracking
-        self._trade_history: List[TradeRecord] = []
-        self._daily_stats: Dict[date, DailyStats] = {}
+        # Trade tracking: the arrays hold the full log for analytics
+        # (see _TradeArrays); the deque is a bounded ring of recent
+        # TradeRecords for review, so memory stays flat long-term
+        self._trades = _TradeArrays()
+        self._trade_history: deque = deque(maxlen=self.TRADE_HISTORY_SIZE)
+
+        # Rolling daily stats: the live day plus a 30-day history ring,
+        # rotated on epoch-day change (cheap int compare per access)
+        self._today = DailyStats()
+        self._today_epoch_day = int(time.time()) // 86400
+        self._history30: deque = deque(maxlen=30)
         self._active_trades = 0
 
         # Running counters for O(1) stats access
@@ -96,6 +149,17 @@ class RiskManager:
         self._circuit_breaker_active = False
         self._circuit_breaker_reason = ""
 
+        # Invoked after a manual breaker reset so the bot can wake a
+        # paused main loop instead of sleeping out its pause timeout
+        self.on_breaker_reset: Optional[Callable] = None
+
+        # Memoized risk level; inputs only change on trade close,
+        # bankroll change, breaker flips or date rollover
+        self._risk_cache: Optional[RiskLevel] = None
+
+        # Absolute thresholds derived from settings and initial bankroll
+        self._recompute_thresholds()
+
         # Load history from database if available
         self._load_history_from_db()
     
@@ -117,13 +181,31 @@ class RiskManager:
     def update_bankroll(self, new_value: float):
         """Update current bankroll."""
         self._current_bankroll = new_value
+        self._risk_cache = None
         logger.info(f"Bankroll updated: ${new_value:.2f}")
 
     def reset_bankroll(self, new_bankroll: float):
         """Reset bankroll to new value (from settings change)."""
         self._initial_bankroll = new_bankroll
         self._current_bankroll = new_bankroll
+        self._risk_cache = None
+        self._recompute_thresholds()
         logger.info(f"Bankroll reset to: ${new_bankroll:.2f}")
+
+    def _recompute_thresholds(self):
+        """
+        Precompute absolute risk thresholds.
+
+        These are constant between bankroll resets, so the per-call
+        percent math in can_trade/assess_risk_level reduces to a few
+        comparisons against cached USD values.
+        """
+        max_loss_frac = self.settings.max_daily_loss_percent / 100
+        self._max_daily_loss_usd = self._initial_bankroll * max_loss_frac
+        self._critical_loss_usd = self._max_daily_loss_usd * 0.8
+        self._high_loss_usd = self._max_daily_loss_usd * 0.5
+        self._med_loss_usd = self._max_daily_loss_usd * 0.3
+        self._inv_initial_bankroll = 1.0 / self._initial_bankroll if self._initial_bankroll else 0.0
     
     def get_max_trade_size(self, price: float) -> int:
         """
@@ -162,9 +244,8 @@ class RiskManager:
         
         # Check daily loss limit
         today_stats = self._get_today_stats()
-        max_daily_loss = self._initial_bankroll * (settings.max_daily_loss_percent / 100)
-        
-        if today_stats.net_pnl < -max_daily_loss:
+
+        if today_stats.net_pnl < -self._max_daily_loss_usd:
             self._activate_circuit_breaker("Daily loss limit exceeded")
             return False, "Daily loss limit exceeded"
         
@@ -176,11 +257,14 @@ class RiskManager:
         return True, "OK"
     
     def _get_today_stats(self) -> DailyStats:
-        """Get or create today's stats."""
-        today = date.today()
-        if today not in self._daily_stats:
-            self._daily_stats[today] = DailyStats(date=today)
-        return self._daily_stats[today]
+        """Get today's stats, rotating into the history ring on rollover."""
+        epoch_day = int(time.time()) // 86400
+        if epoch_day != self._today_epoch_day:
+            self._history30.append(self._today)
+            self._today = DailyStats()
+            self._today_epoch_day = epoch_day
+            self._risk_cache = None  # Date rollover resets daily metrics
+        return self._today
     
     def record_trade_open(self):
         """Record that a trade has been opened."""
@@ -195,6 +279,7 @@ class RiskManager:
             trade: The completed trade record
         """
         self._active_trades = max(0, self._active_trades - 1)
+        self._trades.append(trade)
         self._trade_history.append(trade)
         
         # Update bankroll
@@ -213,7 +298,9 @@ class RiskManager:
             stats.gross_loss += abs(trade.pnl)
             self._total_losses += 1  # Running counter
 
-        logger.info(f"Trade closed: {trade.side} {trade.market} | PnL: ${trade.pnl:.2f}")
+        self._risk_cache = None
+
+        logger.info("Trade closed: %s %s | PnL: $%.2f", trade.side, trade.market, trade.pnl)
 
         # Persist to database
         if self._database:
@@ -231,9 +318,8 @@ class RiskManager:
             # Load today's stats from database
             db_stats = self._database.get_daily_stats()
             if db_stats:
-                today = date.today()
-                self._daily_stats[today] = DailyStats(
-                    date=today,
+                self._today = DailyStats(
+                    date=date.today(),
                     trades=db_stats['trades'],
                     wins=db_stats['wins'],
                     losses=db_stats['losses'],
@@ -257,33 +343,42 @@ class RiskManager:
         Returns:
             Current risk level
         """
-        settings = self.settings
+        if self._risk_cache is not None:
+            return self._risk_cache
+
         today_stats = self._get_today_stats()
-        
-        # Calculate metrics
-        daily_loss_pct = abs(today_stats.net_pnl / self._initial_bankroll * 100) if today_stats.net_pnl < 0 else 0
-        bankroll_drawdown = (1 - self._current_bankroll / self._initial_bankroll) * 100
-        
-        if daily_loss_pct > settings.max_daily_loss_percent * 0.8 or bankroll_drawdown > 20:
-            return RiskLevel.CRITICAL
-        elif daily_loss_pct > settings.max_daily_loss_percent * 0.5 or bankroll_drawdown > 10:
-            return RiskLevel.HIGH
-        elif daily_loss_pct > settings.max_daily_loss_percent * 0.3 or bankroll_drawdown > 5:
-            return RiskLevel.MEDIUM
+
+        # Compare against precomputed absolute thresholds
+        daily_loss_usd = -today_stats.net_pnl if today_stats.net_pnl < 0 else 0.0
+        bankroll_drawdown = (1 - self._current_bankroll * self._inv_initial_bankroll) * 100
+
+        if daily_loss_usd > self._critical_loss_usd or bankroll_drawdown > 20:
+            level = RiskLevel.CRITICAL
+        elif daily_loss_usd > self._high_loss_usd or bankroll_drawdown > 10:
+            level = RiskLevel.HIGH
+        elif daily_loss_usd > self._med_loss_usd or bankroll_drawdown > 5:
+            level = RiskLevel.MEDIUM
         else:
-            return RiskLevel.LOW
+            level = RiskLevel.LOW
+
+        self._risk_cache = level
+        return level
     
     def _activate_circuit_breaker(self, reason: str):
         """Activate the circuit breaker."""
         self._circuit_breaker_active = True
         self._circuit_breaker_reason = reason
+        self._risk_cache = None
         logger.warning(f"🔴 Circuit breaker activated: {reason}")
     
     def reset_circuit_breaker(self):
         """Manually reset the circuit breaker."""
         self._circuit_breaker_active = False
         self._circuit_breaker_reason = ""
+        self._risk_cache = None
         logger.info("Circuit breaker reset")
+        if self.on_breaker_reset:
+            self.on_breaker_reset()
     
     def get_stats(self) -> Dict:
         """Get comprehensive risk statistics."""
@@ -306,12 +401,30 @@ class RiskManager:
                 'win_rate': today_stats.win_rate
             },
             'all_time': {
-                'total_trades': len(self._trade_history),
+                'total_trades': len(self._trades),
                 'winning_trades': self._total_wins,  # O(1) using running counter
                 'losing_trades': self._total_losses  # O(1) using running counter
             }
         }
     
+    def rolling_drawdown(self, window: Optional[int] = None) -> float:
+        """
+        Maximum drawdown of cumulative PnL over the last `window` trades.
+
+        Args:
+            window: Number of most recent trades to consider (all if None)
+
+        Returns:
+            Largest peak-to-trough drop in dollars (0.0 if no trades)
+        """
+        n = self._trades.n
+        if n == 0:
+            return 0.0
+
+        start = max(0, n - window) if window else 0
+        cum = np.cumsum(self._trades.pnl[start:n])
+        return float(np.max(np.maximum.accumulate(cum) - cum))
+
     def should_reduce_size(self) -> bool:
         """Check if position sizes should be reduced due to risk."""
         risk = self.assess_risk_level()
@@ -6,14 +6,21 @@ Scans markets for frontrunning opportunities with optimized polling.
 import asyncio
 import logging
 import time
-from collections import OrderedDict
+from collections import deque
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Callable, TypeVar, Generic
-from datetime import datetime, timedelta
+from datetime import datetime
 
+import aiohttp
+import numpy as np
 from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import OrderBookSummary
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 from config.settings import get_settings
 from typing import TYPE_CHECKING
 
@@ -26,31 +33,94 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 
+def _extract_active(markets: List[Dict]) -> List[tuple]:
+    """Reduce raw market dicts to (token_id, name) pairs for active markets.
+
+    One comprehension pass over the API payload instead of repeated
+    .get() calls inside the scan loop.
+    """
+    return [
+        (m.get('condition_id') or m.get('token_id'), (m.get('question') or 'Unknown')[:50])
+        for m in markets
+        if m.get('active') and (m.get('condition_id') or m.get('token_id'))
+    ]
+
+
+def _top5_size(levels) -> float:
+    """Sum the sizes of up to five {'price','size'} book levels.
+
+    Indexed loop instead of sum()-over-generator-over-slice: no slice
+    allocation, no generator frame — this runs once per market per scan.
+    """
+    s = 0.0
+    n = len(levels)
+    if n > 5:
+        n = 5
+    for i in range(n):
+        s += float(levels[i]['size'])
+    return s
+
+
 class LRUCache(Generic[T]):
-    """LRU Cache with max size and automatic eviction."""
+    """
+    Bounded cache with CLOCK second-chance eviction.
+
+    Entries are [value, visited] pairs in a plain insertion-ordered
+    dict. A hit only flips the visited bit — no reordering — and
+    eviction cycles from the front, giving visited entries a second
+    chance. Near-LRU hit rates on skewed access patterns (a hot set of
+    actively traded markets) without paying a reorder on every get.
+    """
 
     def __init__(self, max_size: int = 500):
-        self._cache: OrderedDict[str, T] = OrderedDict()
+        self._cache: Dict[str, list] = {}
         self.max_size = max_size
         self._hits = 0
         self._misses = 0
 
     def get(self, key: str, default: T = None) -> Optional[T]:
-        """Get item and move to end (most recently used)."""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-            self._hits += 1
-            return self._cache[key]
-        self._misses += 1
-        return default
+        """Get item, marking it visited (no reorder on hit)."""
+        entry = self._cache.get(key)
+        if entry is None:
+            self._misses += 1
+            return default
+        entry[1] = True
+        self._hits += 1
+        return entry[0]
 
     def set(self, key: str, value: T) -> None:
-        """Set item and evict oldest if over capacity."""
-        if key in self._cache:
-            self._cache.move_to_end(key)
-        self._cache[key] = value
-        if len(self._cache) > self.max_size:
-            self._cache.popitem(last=False)  # Evict oldest
+        """Set item and evict via second chance if over capacity."""
+        entry = self._cache.get(key)
+        if entry is not None:
+            entry[0] = value
+            entry[1] = True
+            return
+        if len(self._cache) >= self.max_size:
+            self._evict_one()
+        self._cache[key] = [value, False]
+
+    def set_and_return_previous(self, key: str, value: T) -> Optional[T]:
+        """Replace an entry and return the old value in one pass.
+
+        Saves the separate get() touch for read-modify-write callers
+        like monitor_orderbook.
+        """
+        prev = self._cache.pop(key, None)
+        if len(self._cache) >= self.max_size:
+            self._evict_one()
+        self._cache[key] = [value, False]
+        return prev[0] if prev is not None else None
+
+    def _evict_one(self) -> None:
+        """Evict the first unvisited entry, cycling visited ones back."""
+        while True:
+            key = next(iter(self._cache))
+            entry = self._cache.pop(key)
+            if entry[1]:
+                entry[1] = False
+                self._cache[key] = entry  # Second chance
+            else:
+                return
 
     def __contains__(self, key: str) -> bool:
         return key in self._cache
@@ -62,7 +132,7 @@ class LRUCache(Generic[T]):
         self._cache.clear()
 
     def values(self) -> List[T]:
-        return list(self._cache.values())
+        return [entry[0] for entry in self._cache.values()]
 
     @property
     def stats(self) -> Dict:
@@ -76,7 +146,7 @@ class LRUCache(Generic[T]):
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketInfo:
     """Information about a scanned market."""
     token_id: str
@@ -86,7 +156,7 @@ class MarketInfo:
     spread: float
     bid_liquidity: float
     ask_liquidity: float
-    last_update: datetime = field(default_factory=datetime.now)
+    last_update: float = field(default_factory=time.monotonic)
     
     @property
     def is_profitable(self) -> bool:
@@ -104,34 +174,65 @@ class MarketInfo:
             'spread': self.spread,
             'bid_liquidity': self.bid_liquidity,
             'ask_liquidity': self.ask_liquidity,
-            'last_update': self.last_update.isoformat()
+            # Map the monotonic stamp back to wall time only when serializing
+            'last_update': datetime.fromtimestamp(
+                time.time() - (time.monotonic() - self.last_update)
+            ).isoformat()
         }
 
 
-@dataclass
+# Structured dtype viewing a (price, size) level as one comparable record
+_LEVEL_DT = np.dtype([('price', np.float64), ('size', np.float64)])
+
+
+def _pack_levels(prices: np.ndarray, sizes: np.ndarray) -> np.ndarray:
+    """View parallel price/size arrays as one structured record array."""
+    rec = np.empty(len(prices), dtype=_LEVEL_DT)
+    rec['price'] = prices
+    rec['size'] = sizes
+    return rec
+
+
+def _unpack_levels(rec: np.ndarray) -> List[tuple]:
+    """Turn a structured record array back into (price, size) tuples."""
+    return [(float(r['price']), float(r['size'])) for r in rec]
+
+
+@dataclass(slots=True)
 class OrderBookSnapshot:
-    """Snapshot of order book for delta detection."""
+    """
+    Snapshot of order book for delta detection.
+
+    Levels are stored structure-of-arrays: two float64 arrays per side
+    instead of a list of tuples (~16 B per level instead of ~72 B), so
+    deltas and sums run vectorized.
+    """
     token_id: str
-    bids: List[tuple]  # (price, size)
-    asks: List[tuple]  # (price, size)
+    bid_prices: np.ndarray
+    bid_sizes: np.ndarray
+    ask_prices: np.ndarray
+    ask_sizes: np.ndarray
     timestamp: float = field(default_factory=time.time)
-    
+
     def get_delta(self, previous: 'OrderBookSnapshot') -> Dict:
-        """Calculate delta between snapshots. Optimized O(n) version."""
+        """Calculate delta between snapshots. Vectorized via set-diff in C."""
+        curr_bids = _pack_levels(self.bid_prices, self.bid_sizes)
+        curr_asks = _pack_levels(self.ask_prices, self.ask_sizes)
+
         if previous is None:
-            return {'new_bids': self.bids, 'new_asks': self.asks}
+            return {
+                'new_bids': _unpack_levels(curr_bids),
+                'new_asks': _unpack_levels(curr_asks)
+            }
 
-        # Build sets once - O(n) instead of O(n²)
-        prev_bids_set = set(previous.bids)
-        prev_asks_set = set(previous.asks)
-        curr_bids_set = set(self.bids)
-        curr_asks_set = set(self.asks)
+        prev_bids = _pack_levels(previous.bid_prices, previous.bid_sizes)
+        prev_asks = _pack_levels(previous.ask_prices, previous.ask_sizes)
 
         return {
-            'new_bids': [b for b in self.bids if b not in prev_bids_set],
-            'new_asks': [a for a in self.asks if a not in prev_asks_set],
-            'removed_bids': [b for b in previous.bids if b not in curr_bids_set],
-            'removed_asks': [a for a in previous.asks if a not in curr_asks_set],
+            'new_bids': _unpack_levels(np.setdiff1d(curr_bids, prev_bids)),
+            'new_asks': _unpack_levels(np.setdiff1d(curr_asks, prev_asks)),
+            'removed_bids': _unpack_levels(np.setdiff1d(prev_bids, curr_bids)),
+            'removed_asks': _unpack_levels(np.setdiff1d(prev_asks, curr_asks)),
             'time_delta': self.timestamp - previous.timestamp
         }
 
@@ -146,20 +247,45 @@ class MarketScanner:
     - Configurable polling intervals
     """
     
-    def __init__(self, client: ClobClient, websocket: Optional['WebSocketManager'] = None):
+    def __init__(
+        self,
+        client: ClobClient,
+        websocket: Optional['WebSocketManager'] = None,
+        market_cache_size: int = 500,
+        orderbook_cache_size: int = 200
+    ):
         self.client = client
         self.settings = get_settings()
         self._websocket = websocket
 
+        # Shared async HTTP session for scan traffic; the connector limit
+        # is the concurrency bound, so fetches truly overlap instead of
+        # blocking the event loop inside the sync SDK
+        self._clob_host = getattr(client, 'host', 'https://clob.polymarket.com').rstrip('/')
+        self._session: Optional[aiohttp.ClientSession] = None
+
+        # Conditional-request state for the markets list: on a 304 the
+        # previous parse is reused and the body transfer is skipped
+        self._markets_etag: Optional[str] = None
+        self._markets_active_cached: List[tuple] = []
+
+        # Hot-loop settings bound once so the filter is a bare float compare
+        self._spread_threshold = float(self.settings.spread_threshold)
+        self._polling_interval = float(self.settings.polling_interval)
+
         # LRU Caches with max size (prevents unbounded memory growth)
-        self._market_cache: LRUCache[MarketInfo] = LRUCache(max_size=500)
-        self._orderbook_cache: LRUCache[OrderBookSnapshot] = LRUCache(max_size=200)
-        self._cache_ttl = timedelta(seconds=30)
+        self._market_cache: LRUCache[MarketInfo] = LRUCache(max_size=market_cache_size)
+        self._orderbook_cache: LRUCache[OrderBookSnapshot] = LRUCache(max_size=orderbook_cache_size)
+        self._cache_ttl = 30.0  # Seconds, compared against time.monotonic()
+        self._cache_version = 0  # Bumped on market cache mutation (for UI memoization)
 
         # State
         self._running = False
-        self._backoff = 1.0
-        self._max_backoff = 30.0
+
+        # Transient-error timestamps; a scan is only throttled when the
+        # recent error rate is high, so one failed market in a large
+        # scan does not poison the next cycle's cadence
+        self._error_window: deque = deque(maxlen=100)
 
         # WebSocket event tracking for real-time detection
         self._ws_new_orders: List[Dict] = []
@@ -173,6 +299,43 @@ class MarketScanner:
         """Set callback functions for updates."""
         self._on_market_update = on_update
         self._on_opportunity = on_opportunity
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Create the shared HTTP session on first use."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=25, limit_per_host=25, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=2.0)
+            )
+        return self._session
+
+    async def close(self):
+        """Close the shared HTTP session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+
+    async def _get_active_markets(self) -> List[tuple]:
+        """Fetch active (token_id, name) pairs, revalidating via ETag."""
+        session = await self._ensure_session()
+        headers = {'If-None-Match': self._markets_etag} if self._markets_etag else None
+
+        async with session.get(f"{self._clob_host}/markets", headers=headers) as resp:
+            if resp.status == 304:
+                # Unchanged upstream: skip the body and the parse entirely
+                return self._markets_active_cached
+
+            # Surface API errors instead of parsing an error body as the
+            # markets payload (and clobbering the active cache with it)
+            resp.raise_for_status()
+
+            # Decode straight from bytes: orjson takes UTF-8 input, so this
+            # skips aiohttp's content-type sniff and charset re-decode
+            data = _loads(await resp.read())
+            self._markets_etag = resp.headers.get('ETag')
+
+        markets = data.get('data', []) if isinstance(data, dict) else data
+        self._markets_active_cached = _extract_active(markets)
+        return self._markets_active_cached
     
     async def scan_markets(self) -> List[MarketInfo]:
         """
@@ -180,79 +343,106 @@ class MarketScanner:
         Uses parallel fetching with semaphore for 10x faster scanning.
         """
         try:
+            # Throttle only under sustained failures (>10 in 10s)
+            now = time.monotonic()
+            recent_errors = sum(1 for t in self._error_window if now - t < 10)
+            if recent_errors > 10:
+                await asyncio.sleep(min(30.0, 0.1 * recent_errors))
+
             # Get active markets from API
-            markets = self.client.get_markets()
+            active_markets = await self._get_active_markets()
 
-            # Filter active markets that need updating
+            # Filter active markets that need updating; one shared result
+            # list avoids the cache+fetch concat at the end
             markets_to_fetch = []
-            profitable_from_cache = []
+            profitable_markets = []
 
-            for market in markets:
-                if not market.get('active', False):
-                    continue
-
-                token_id = market.get('condition_id') or market.get('token_id')
-                if not token_id:
-                    continue
+            now = time.monotonic()
 
+            for token_id, name in active_markets:
                 # Check cache first
                 cached = self._market_cache.get(token_id)
-                if cached and (datetime.now() - cached.last_update) < self._cache_ttl:
-                    if cached.is_profitable:
-                        profitable_from_cache.append(cached)
+                if cached and (now - cached.last_update) < self._cache_ttl:
+                    if cached.spread >= self._spread_threshold:
+                        profitable_markets.append(cached)
                     continue
 
-                markets_to_fetch.append((token_id, market.get('question', 'Unknown')))
-
-            # Parallel fetch with semaphore (max 25 concurrent for faster scanning)
-            semaphore = asyncio.Semaphore(25)
-
-            async def fetch_with_limit(token_id: str, name: str):
-                async with semaphore:
-                    return await self._fetch_market_info(token_id, name)
+                markets_to_fetch.append((token_id, name))
 
+            # Parallel fetch through a fixed pool of worker coroutines:
+            # 25 Tasks total instead of one per market, matching the
+            # session connector's concurrency limit
             if markets_to_fetch:
-                tasks = [fetch_with_limit(tid, name) for tid, name in markets_to_fetch]
-                results = await asyncio.gather(*tasks, return_exceptions=True)
+                work: asyncio.Queue = asyncio.Queue()
+                for item in markets_to_fetch:
+                    work.put_nowait(item)
+
+                results: List[Optional[MarketInfo]] = []
+
+                async def worker():
+                    while True:
+                        try:
+                            tid, name = work.get_nowait()
+                        except asyncio.QueueEmpty:
+                            return
+                        try:
+                            results.append(await self._fetch_market_info(tid, name))
+                        except Exception as e:
+                            logger.debug(f"Fetch failed for {tid}: {e}")
+
+                async with asyncio.TaskGroup() as tg:
+                    for _ in range(min(25, len(markets_to_fetch))):
+                        tg.create_task(worker())
 
-                profitable_from_fetch = []
                 for result in results:
                     if isinstance(result, MarketInfo):
                         self._market_cache.set(result.token_id, result)
-                        if result.is_profitable:
-                            profitable_from_fetch.append(result)
+                        self._cache_version += 1
+                        if result.spread >= self._spread_threshold:
+                            profitable_markets.append(result)
                             logger.info(f"Profitable: {result.market_name} (spread: ${result.spread:.3f})")
 
-                profitable_markets = profitable_from_cache + profitable_from_fetch
-            else:
-                profitable_markets = profitable_from_cache
-
-            # Reset backoff on success
-            self._backoff = 1.0
+            # Subscribe profitable markets so future cycles are fed by
+            # WebSocket push frames instead of REST round-trips
+            if self._websocket and self._websocket.is_connected:
+                await asyncio.gather(
+                    *(self._websocket.subscribe_market(m.token_id) for m in profitable_markets),
+                    return_exceptions=True
+                )
 
             return profitable_markets
 
         except Exception as e:
             logger.error(f"Error scanning markets: {e}")
-            self._backoff = min(self._backoff * 2, self._max_backoff)
+            self._error_window.append(time.monotonic())
             return []
     
     async def _fetch_market_info(self, token_id: str, market_name: str) -> Optional[MarketInfo]:
-        """Fetch order book and create MarketInfo."""
+        """Fetch order book and create MarketInfo (WebSocket push preferred)."""
+        # Fresh WebSocket data avoids a REST round-trip entirely
+        info = self._market_info_from_ws(token_id, market_name)
+        if info:
+            return info
+
         try:
-            book: OrderBookSummary = self.client.get_order_book(token_id)
-            
-            if not book.bids or not book.asks:
+            session = await self._ensure_session()
+            async with session.get(f"{self._clob_host}/book", params={'token_id': token_id}) as resp:
+                data = _loads(await resp.read())
+
+            bids = data.get('bids') or []
+            asks = data.get('asks') or []
+
+            if not bids or not asks:
                 return None
-            
-            best_bid = float(book.bids[0].price) if book.bids else 0
-            best_ask = float(book.asks[0].price) if book.asks else 1
-            
-            bid_liquidity = sum(float(b.size) for b in book.bids[:5])
-            ask_liquidity = sum(float(a.size) for a in book.asks[:5])
-            
+
+            best_bid = float(bids[0]['price'])
+            best_ask = float(asks[0]['price'])
+
+            bid_liquidity = _top5_size(bids)
+            ask_liquidity = _top5_size(asks)
+
             spread = best_ask - best_bid
-            
+
             return MarketInfo(
                 token_id=token_id,
                 market_name=market_name[:50],  # Truncate long names
@@ -262,10 +452,42 @@ class MarketScanner:
                 bid_liquidity=bid_liquidity,
                 ask_liquidity=ask_liquidity
             )
-            
+
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            # Network-level failures count toward the scan throttle
+            self._error_window.append(time.monotonic())
+            logger.debug(f"Error fetching order book for {token_id}: {e}")
+            return None
         except Exception as e:
             logger.debug(f"Error fetching order book for {token_id}: {e}")
             return None
+
+    def _market_info_from_ws(self, token_id: str, market_name: str) -> Optional[MarketInfo]:
+        """Build MarketInfo from the WebSocket book cache if fresh enough."""
+        if not self._websocket or not self._websocket.is_connected:
+            return None
+
+        update = self._websocket.get_orderbook(token_id)
+        if update is None or len(update.bids) == 0 or len(update.asks) == 0:
+            return None
+
+        # Fall back to REST when the pushed book has gone stale
+        max_age = self._polling_interval * 5
+        if time.monotonic() - update.timestamp > max_age:
+            return None
+
+        best_bid = float(update.bids[0, 0])
+        best_ask = float(update.asks[0, 0])
+
+        return MarketInfo(
+            token_id=token_id,
+            market_name=market_name[:50],
+            best_bid=best_bid,
+            best_ask=best_ask,
+            spread=best_ask - best_bid,
+            bid_liquidity=float(update.bids[:5, 1].sum()),
+            ask_liquidity=float(update.asks[:5, 1].sum())
+        )
     
     async def monitor_orderbook(self, token_id: str) -> Optional[Dict]:
         """
@@ -277,13 +499,14 @@ class MarketScanner:
             
             current = OrderBookSnapshot(
                 token_id=token_id,
-                bids=[(float(b.price), float(b.size)) for b in book.bids],
-                asks=[(float(a.price), float(a.size)) for a in book.asks]
+                bid_prices=np.fromiter((float(b.price) for b in book.bids), dtype=np.float64, count=len(book.bids)),
+                bid_sizes=np.fromiter((float(b.size) for b in book.bids), dtype=np.float64, count=len(book.bids)),
+                ask_prices=np.fromiter((float(a.price) for a in book.asks), dtype=np.float64, count=len(book.asks)),
+                ask_sizes=np.fromiter((float(a.size) for a in book.asks), dtype=np.float64, count=len(book.asks))
             )
             
-            previous = self._orderbook_cache.get(token_id)
-            self._orderbook_cache.set(token_id, current)
-            
+            previous = self._orderbook_cache.set_and_return_previous(token_id, current)
+
             if previous:
                 delta = current.get_delta(previous)
                 return delta
@@ -299,51 +522,65 @@ class MarketScanner:
         Detect large counter-orders within timeout window.
         Uses WebSocket for real-time detection (<50ms) or falls back to REST polling.
         """
-        settings = get_settings()
-
         # Use WebSocket if available and connected (faster detection)
-        if self._websocket and self._websocket.is_connected and settings.websocket_enabled:
+        if self._websocket and self._websocket.is_connected and self.settings.websocket_enabled:
             return await self._detect_counter_order_ws(token_id, min_size, timeout)
 
         # Fallback to REST polling
         return await self._detect_counter_order_rest(token_id, min_size, timeout)
 
     async def _detect_counter_order_ws(self, token_id: str, min_size: int, timeout: float) -> Optional[Dict]:
-        """WebSocket-based counter-order detection (<50ms latency)."""
+        """WebSocket-based counter-order detection (single-ms latency)."""
         # Subscribe to market if not already
         await self._websocket.subscribe_market(token_id)
 
         # Get initial snapshot
         initial_book = self._websocket.get_orderbook(token_id)
-        initial_bids = set(initial_book.bids) if initial_book else set()
-        initial_asks = set(initial_book.asks) if initial_book else set()
-
-        start_time = time.time()
-        check_interval = 0.02  # 20ms check interval for WebSocket
-
-        while time.time() - start_time < timeout:
-            current_book = self._websocket.get_orderbook(token_id)
-
-            if current_book:
-                # Detect new large bids
-                for bid in current_book.bids:
-                    if bid not in initial_bids and bid[1] >= min_size:
-                        logger.info(f"[WS] Counter-order: BID {bid[1]} @ {bid[0]}")
-                        return {'side': 'BID', 'price': bid[0], 'size': bid[1]}
-
-                # Detect new large asks
-                for ask in current_book.asks:
-                    if ask not in initial_asks and ask[1] >= min_size:
-                        logger.info(f"[WS] Counter-order: ASK {ask[1]} @ {ask[0]}")
-                        return {'side': 'ASK', 'price': ask[0], 'size': ask[1]}
+        if initial_book is not None:
+            initial_bids = _pack_levels(initial_book.bids[:, 0], initial_book.bids[:, 1])
+            initial_asks = _pack_levels(initial_book.asks[:, 0], initial_book.asks[:, 1])
+        else:
+            initial_bids = np.empty(0, dtype=_LEVEL_DT)
+            initial_asks = np.empty(0, dtype=_LEVEL_DT)
+
+        # Wake exactly when the receive loop pushes a fresh book instead
+        # of re-walking the cached book on a 20ms poll
+        deadline = time.monotonic() + timeout
+
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
 
-            await asyncio.sleep(check_interval)
+            try:
+                book = await asyncio.wait_for(
+                    self._websocket.next_book_update(token_id), timeout=remaining
+                )
+            except asyncio.TimeoutError:
+                return None
 
-        return None
+            # One C-level set difference per side, then threshold only
+            # the levels that actually changed
+            new_bids = np.setdiff1d(
+                _pack_levels(book.bids[:, 0], book.bids[:, 1]), initial_bids
+            )
+            hits = new_bids[new_bids['size'] >= min_size]
+            if hits.size:
+                price, size = float(hits[0]['price']), float(hits[0]['size'])
+                logger.info("[WS] Counter-order: BID %s @ %s", size, price)
+                return {'side': 'BID', 'price': price, 'size': size}
+
+            new_asks = np.setdiff1d(
+                _pack_levels(book.asks[:, 0], book.asks[:, 1]), initial_asks
+            )
+            hits = new_asks[new_asks['size'] >= min_size]
+            if hits.size:
+                price, size = float(hits[0]['price']), float(hits[0]['size'])
+                logger.info("[WS] Counter-order: ASK %s @ %s", size, price)
+                return {'side': 'ASK', 'price': price, 'size': size}
 
     async def _detect_counter_order_rest(self, token_id: str, min_size: int, timeout: float) -> Optional[Dict]:
         """REST polling fallback for counter-order detection."""
-        settings = get_settings()
         start_time = time.time()
 
         while time.time() - start_time < timeout:
@@ -360,7 +597,7 @@ class MarketScanner:
                         logger.info(f"Counter-order detected: ASK {ask[1]} @ {ask[0]}")
                         return {'side': 'ASK', 'price': ask[0], 'size': ask[1]}
 
-            await asyncio.sleep(settings.polling_interval)
+            await asyncio.sleep(self._polling_interval)
 
         return None
 
@@ -369,11 +606,17 @@ class MarketScanner:
         self._websocket = websocket
         logger.info("WebSocket manager connected to scanner")
     
+    @property
+    def cache_version(self) -> int:
+        """Monotonic version of the market cache (changes on mutation)."""
+        return self._cache_version
+
     def clear_cache(self):
         """Clear all caches."""
         self._market_cache.clear()
         self._orderbook_cache.clear()
-        
+        self._cache_version += 1
+
     def get_cached_markets(self) -> List[MarketInfo]:
         """Get all cached markets."""
         return self._market_cache.values()
@@ -11,6 +11,8 @@ from enum import Enum
 from typing import Optional, Callable, Dict, Any, List
 from datetime import datetime
 
+import numpy as np
+
 from config.settings import get_settings
 from .scanner import MarketScanner, MarketInfo
 
@@ -21,11 +23,38 @@ FRONTRUN_SPREAD_PERCENT = 0.10  # 10% of spread for frontrun offset
 FRONTRUN_MAX_OFFSET = 0.02  # Max $0.02 frontrun offset
 COOLDOWN_NO_MARKET = 5  # Seconds to wait when no market found
 COOLDOWN_AFTER_TRADE = 2  # Seconds to wait after trade
-SORTED_CACHE_TTL = 5.0  # Seconds to cache sorted markets
 
 logger = logging.getLogger(__name__)
 
 
+def _market_score(m: MarketInfo) -> tuple:
+    """Target-selection score: widest spread first, then deepest book."""
+    return (m.spread, m.bid_liquidity + m.ask_liquidity)
+
+
+def _opportunity_math(
+    counter_price: float,
+    counter_size: float,
+    max_trade_amount: float,
+    offset: float,
+    is_bid: bool,
+) -> tuple:
+    """Pure scalar math for the reaction path.
+
+    Takes plain floats (no dict or attribute lookups inside) and
+    returns (entry_price, target_size, estimated_profit) so the
+    latency-critical stretch between counter-order detection and
+    frontrun placement does only arithmetic.
+    """
+    if is_bid:
+        entry_price = counter_price - offset
+    else:
+        entry_price = counter_price + offset
+    target_size = min(int(counter_size), int(max_trade_amount / entry_price))
+    estimated_profit = abs(counter_price - entry_price) * target_size
+    return entry_price, target_size, estimated_profit
+
+
 class StrategyState(Enum):
     """Current state of the strategy."""
     IDLE = "idle"
@@ -36,7 +65,7 @@ class StrategyState(Enum):
     COOLDOWN = "cooldown"
 
 
-@dataclass
+@dataclass(slots=True)
 class TradeOpportunity:
     """Represents a detected frontrun opportunity."""
     token_id: str
@@ -61,7 +90,7 @@ class TradeOpportunity:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class BaitOrder:
     """Represents our bait (micro) order."""
     order_id: Optional[str] = None
@@ -88,9 +117,10 @@ class FrontrunStrategy:
     5. Manage risk and repeat
     """
     
-    def __init__(self, scanner: MarketScanner, executor=None):
+    def __init__(self, scanner: MarketScanner, executor=None, websocket=None):
         self.scanner = scanner
         self.executor = executor
+        self.websocket = websocket
         self.settings = get_settings()
         
         # State
@@ -98,9 +128,8 @@ class FrontrunStrategy:
         self.current_bait: Optional[BaitOrder] = None
         self.current_target: Optional[MarketInfo] = None
 
-        # Cache for sorted markets (avoids O(n log n) sort every scan)
-        self._sorted_markets_cache: Optional[List[MarketInfo]] = None
-        self._sorted_cache_time: float = 0
+        # Scratch buffer for allocation-free top-of-book reads
+        self._best_scratch = np.empty(2, dtype=np.float64)
 
         # Statistics
         self.trades_executed = 0
@@ -120,13 +149,22 @@ class FrontrunStrategy:
         self._on_state_change = on_state_change
         self._on_opportunity = on_opportunity
         self._on_trade = on_trade
-    
+
+    def _dispatch(self, callback: Callable, payload):
+        """Schedule a UI callback without blocking the current cycle."""
+        try:
+            asyncio.get_running_loop().call_soon(callback, payload)
+        except RuntimeError:
+            callback(payload)
+
     def _set_state(self, new_state: StrategyState):
-        """Update state and notify UI."""
+        """Update state and notify UI (no-op transitions are skipped)."""
+        if new_state is self.state:
+            return
         self.state = new_state
-        logger.info(f"Strategy state: {new_state.value}")
+        logger.debug("Strategy state: %s", new_state.value)
         if self._on_state_change:
-            self._on_state_change(new_state.value)
+            self._dispatch(self._on_state_change, new_state.value)
 
     def _calculate_bait_offset(self, spread: float) -> float:
         """Calculate dynamic bait offset based on spread (25% of spread, max $0.05)."""
@@ -137,7 +175,7 @@ class FrontrunStrategy:
         return min(spread * FRONTRUN_SPREAD_PERCENT, FRONTRUN_MAX_OFFSET)
 
     async def find_target(self) -> Optional[MarketInfo]:
-        """Find best market to target. Uses cached sorted results."""
+        """Find best market to target."""
         self._set_state(StrategyState.SCANNING)
 
         markets = await self.scanner.scan_markets()
@@ -146,20 +184,10 @@ class FrontrunStrategy:
             logger.debug("No profitable markets found")
             return None
 
-        # Use cached sorted markets if still valid
-        now = time.time()
-        if (self._sorted_markets_cache is not None and
-            now - self._sorted_cache_time < SORTED_CACHE_TTL and
-            len(self._sorted_markets_cache) == len(markets)):
-            sorted_markets = self._sorted_markets_cache
-        else:
-            # Sort by spread (highest first) and liquidity
-            sorted_markets = sorted(markets, key=lambda m: (m.spread, m.bid_liquidity + m.ask_liquidity), reverse=True)
-            self._sorted_markets_cache = sorted_markets
-            self._sorted_cache_time = now
-
-        best = sorted_markets[0]
-        logger.info(f"Target selected: {best.market_name} (spread: ${best.spread:.3f})")
+        # Only the top market is ever consumed: a single linear max()
+        # beats sorting the whole list every cycle
+        best = max(markets, key=_market_score)
+        logger.info("Target selected: %s (spread: $%.3f)", best.market_name, best.spread)
 
         return best
     
@@ -175,10 +203,20 @@ class FrontrunStrategy:
         self._set_state(StrategyState.BAITING)
 
         settings = self.settings
-        mid_price = (market.best_bid + market.best_ask) / 2
+
+        # Prefer the live WebSocket top-of-book over the scan-time
+        # snapshot: the bait lands on the latest tick, not where the
+        # market was a scan cycle ago
+        best_bid, best_ask = market.best_bid, market.best_ask
+        if self.websocket is not None and self.websocket.is_connected:
+            if self.websocket.get_best_prices_into(market.token_id, self._best_scratch):
+                best_bid = self._best_scratch[0]
+                best_ask = self._best_scratch[1]
+
+        mid_price = (best_bid + best_ask) * 0.5
 
         # Dynamic bait offset: 25% of spread, max $0.05
-        bait_offset = self._calculate_bait_offset(market.spread)
+        bait_offset = self._calculate_bait_offset(best_ask - best_bid)
         bait_price = round(mid_price - bait_offset, 3)  # Slightly below mid for buy
         
         try:
@@ -232,19 +270,17 @@ class FrontrunStrategy:
         # Dynamic frontrun offset: 10% of spread, max $0.02
         frontrun_offset = self._calculate_frontrun_offset(market.spread)
 
-        if counter['side'] == 'BID':
-            # Someone is buying, we should buy first (then sell to them)
-            our_side = 'BUY'
-            entry_price = counter['price'] - frontrun_offset  # Slightly better price
-        else:
-            # Someone is selling, we should sell first
-            our_side = 'SELL'
-            entry_price = counter['price'] + frontrun_offset
-        
-        # Estimate profit (simplified)
-        spread_capture = abs(counter['price'] - entry_price)
-        target_size = min(counter['size'], int(settings.max_trade_amount / entry_price))
-        estimated_profit = spread_capture * target_size
+        # Counter BID: someone is buying, we buy first (then sell to
+        # them); counter ASK: someone is selling, we sell first
+        is_bid = counter['side'] == 'BID'
+        our_side = 'BUY' if is_bid else 'SELL'
+        entry_price, target_size, estimated_profit = _opportunity_math(
+            counter['price'],
+            counter['size'],
+            settings.max_trade_amount,
+            frontrun_offset,
+            is_bid,
+        )
         
         opportunity = TradeOpportunity(
             token_id=token_id,
@@ -259,7 +295,7 @@ class FrontrunStrategy:
         logger.info(f"Opportunity detected: {our_side} {target_size} @ ${entry_price:.3f} (est. profit: ${estimated_profit:.2f})")
         
         if self._on_opportunity:
-            self._on_opportunity(opportunity.to_dict())
+            self._dispatch(self._on_opportunity, opportunity.to_dict())
         
         return opportunity
     
@@ -289,7 +325,7 @@ class FrontrunStrategy:
                 logger.info(f"Frontrun executed! PnL: ${opportunity.estimated_profit:.2f}")
                 
                 if self._on_trade:
-                    self._on_trade({
+                    self._dispatch(self._on_trade, {
                         'market': opportunity.market_name,
                         'side': opportunity.side,
                         'size': opportunity.target_size,
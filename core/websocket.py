@@ -4,6 +4,7 @@ Real-time order book streaming with <50ms latency.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import time
@@ -11,11 +12,42 @@ from typing import Dict, Optional, Callable, Set, List
 from dataclasses import dataclass, field
 from enum import Enum
 
+import numpy as np
 import websockets
 from websockets.exceptions import ConnectionClosed
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
 logger = logging.getLogger(__name__)
 
+# Shared empty book side; (0, 2) so column indexing stays valid
+_EMPTY_SIDE = np.empty((0, 2), dtype=np.float64)
+
+# Canonical heartbeat frames; pings arrive on a fixed schedule, so
+# answering them must not cost a JSON parse
+_PING_PREFIX = '{"type":"ping"'
+_PONG_FRAME = '{"type":"pong"}'
+
+
+def _fill_levels(out: np.ndarray, raw: list) -> None:
+    """Write raw {'price','size'} levels into an existing (N, 2) array."""
+    for i, level in enumerate(raw):
+        out[i, 0] = float(level["price"])
+        out[i, 1] = float(level["size"])
+
+
+def _parse_levels(raw: list) -> np.ndarray:
+    """Parse raw {'price','size'} levels into an (N, 2) float64 array."""
+    n = len(raw)
+    if n == 0:
+        return _EMPTY_SIDE
+    levels = np.empty((n, 2), dtype=np.float64)
+    _fill_levels(levels, raw)
+    return levels
+
 
 class ConnectionState(Enum):
     """WebSocket connection state."""
@@ -25,13 +57,19 @@ class ConnectionState(Enum):
     RECONNECTING = "reconnecting"
 
 
-@dataclass
+@dataclass(slots=True)
 class OrderBookUpdate:
-    """Real-time order book update from WebSocket."""
+    """Real-time order book update from WebSocket.
+
+    Levels are (N, 2) float64 arrays of (price, size) rows: two
+    contiguous buffers per message instead of a boxed tuple per level.
+    """
     token_id: str
-    bids: List[tuple]  # (price, size)
-    asks: List[tuple]  # (price, size)
-    timestamp: float = field(default_factory=time.time)
+    bids: np.ndarray  # (N, 2): price, size
+    asks: np.ndarray  # (N, 2): price, size
+    # Monotonic receive stamp: age math stays correct across NTP
+    # adjustments and suspend/resume
+    timestamp: float = field(default_factory=time.monotonic)
     is_snapshot: bool = False
 
 
@@ -55,9 +93,17 @@ class WebSocketManager:
         self._state = ConnectionState.DISCONNECTED
         self._subscribed_markets: Set[str] = set()
 
+        # Serialized subscribe frames, built once per token and reused
+        # on every resubscribe after reconnect
+        self._sub_frames: Dict[str, str] = {}
+
         # Order book cache (real-time from WebSocket)
         self._orderbook_cache: Dict[str, OrderBookUpdate] = {}
 
+        # Per-token update queues for awaitable push delivery
+        # (created on demand by next_book_update)
+        self._update_queues: Dict[str, asyncio.Queue] = {}
+
         # Callbacks
         self._on_orderbook_update: Optional[Callable[[OrderBookUpdate], None]] = None
         self._on_connection_change: Optional[Callable[[ConnectionState], None]] = None
@@ -67,6 +113,9 @@ class WebSocketManager:
         self._max_backoff = 30.0
         self._reconnect_task: Optional[asyncio.Task] = None
 
+        # Receive-loop error backoff (only applied after failed recv)
+        self._err_backoff = 0.05
+
         # Running state
         self._running = False
         self._receive_task: Optional[asyncio.Task] = None
@@ -74,6 +123,7 @@ class WebSocketManager:
         # Stats
         self._messages_received = 0
         self._last_message_time: Optional[float] = None
+        self._callback_errors = 0
 
     @property
     def state(self) -> ConnectionState:
@@ -166,10 +216,8 @@ class WebSocketManager:
                 pass
 
         if self._connection:
-            try:
+            with contextlib.suppress(Exception):
                 await self._connection.close()
-            except Exception:
-                pass
 
         self._connection = None
         self._set_state(ConnectionState.DISCONNECTED)
@@ -194,14 +242,9 @@ class WebSocketManager:
             return False
 
         try:
-            subscribe_msg = {
-                "type": "subscribe",
-                "channel": "book",
-                "market": token_id
-            }
-            await self._connection.send(json.dumps(subscribe_msg))
+            await self._connection.send(self._subscribe_frame(token_id))
             self._subscribed_markets.add(token_id)
-            logger.debug(f"Subscribed to market: {token_id}")
+            logger.debug("Subscribed to market: %s", token_id)
             return True
 
         except Exception as e:
@@ -226,30 +269,70 @@ class WebSocketManager:
 
         self._subscribed_markets.discard(token_id)
         self._orderbook_cache.pop(token_id, None)
+        self._update_queues.pop(token_id, None)
+        self._sub_frames.pop(token_id, None)
+
+    def _subscribe_frame(self, token_id: str) -> str:
+        """Get the serialized subscribe frame for a token (cached)."""
+        frame = self._sub_frames.get(token_id)
+        if frame is None:
+            frame = json.dumps({
+                "type": "subscribe",
+                "channel": "book",
+                "market": token_id
+            })
+            self._sub_frames[token_id] = frame
+        return frame
 
     async def _resubscribe(self):
-        """Resubscribe to all markets after reconnection."""
-        for token_id in list(self._subscribed_markets):
-            try:
-                subscribe_msg = {
-                    "type": "subscribe",
-                    "channel": "book",
-                    "market": token_id
-                }
-                await self._connection.send(json.dumps(subscribe_msg))
-                await asyncio.sleep(0.05)  # Rate limit
-            except Exception as e:
-                logger.error(f"Failed to resubscribe to {token_id}: {e}")
+        """Resubscribe to all markets after reconnection.
+
+        Sends are pipelined with gather so subscription state is
+        restored in one burst instead of one awaited send per market.
+        """
+        tokens = list(self._subscribed_markets)
+        if not tokens:
+            return
+
+        send = self._connection.send
+        results = await asyncio.gather(
+            *(send(self._subscribe_frame(t)) for t in tokens),
+            return_exceptions=True
+        )
+        for token_id, result in zip(tokens, results):
+            if isinstance(result, Exception):
+                logger.error(f"Failed to resubscribe to {token_id}: {result}")
+
+    # Max buffered messages drained per loop iteration
+    _DRAIN_BATCH = 32
 
     async def _receive_loop(self):
         """Main receive loop for WebSocket messages."""
+        # Pre-bind per-iteration lookups; the loop lives and dies with
+        # this connection, so binding recv once is safe
+        recv = self._connection.recv
+        handle = self._handle_message
+        monotonic = time.monotonic
+
         while self._running and self._connection:
             try:
-                message = await self._connection.recv()
-                self._messages_received += 1
-                self._last_message_time = time.time()
+                message = await recv()
+                self._err_backoff = 0.05
+
+                # During bursts the protocol buffers frames behind the
+                # one recv() returned; drain them in the same wakeup so
+                # parse+dispatch isn't serialized behind the event loop
+                batch = [message]
+                buffered = getattr(self._connection, 'messages', None)
+                if buffered:
+                    while buffered and len(batch) < self._DRAIN_BATCH:
+                        batch.append(buffered.popleft())
+
+                self._messages_received += len(batch)
+                self._last_message_time = monotonic()
 
-                await self._handle_message(message)
+                for msg in batch:
+                    await handle(msg)
 
             except ConnectionClosed as e:
                 logger.warning(f"WebSocket connection closed: {e}")
@@ -258,7 +341,10 @@ class WebSocketManager:
                 break
             except Exception as e:
                 logger.error(f"Error receiving message: {e}")
-                await asyncio.sleep(0.1)
+                # Exponential backoff so a repeatedly failing socket
+                # doesn't spin the loop; happy path never sleeps
+                self._err_backoff = min(self._err_backoff * 2, 1.0)
+                await asyncio.sleep(self._err_backoff)
 
         # Connection lost, attempt reconnect
         if self._running:
@@ -267,24 +353,30 @@ class WebSocketManager:
 
     async def _handle_message(self, raw_message: str):
         """Handle incoming WebSocket message."""
+        # Heartbeat fast path: prefix sniff, no decode
+        if raw_message.startswith(_PING_PREFIX):
+            await self._connection.send(_PONG_FRAME)
+            return
+
         try:
-            data = json.loads(raw_message)
+            data = _loads(raw_message)
             msg_type = data.get("type", "")
 
             if msg_type == "book":
                 await self._handle_orderbook_update(data)
             elif msg_type == "subscribed":
-                logger.debug(f"Subscription confirmed: {data.get('market')}")
+                logger.debug("Subscription confirmed: %s", data.get('market'))
             elif msg_type == "error":
                 logger.error(f"WebSocket error: {data.get('message')}")
             elif msg_type == "ping":
-                # Respond to ping
-                await self._connection.send(json.dumps({"type": "pong"}))
+                # Ping with non-canonical key order lands here
+                await self._connection.send(_PONG_FRAME)
 
-        except json.JSONDecodeError:
-            logger.error(f"Invalid JSON message: {raw_message[:100]}")
+        except ValueError:
+            # Covers both json.JSONDecodeError and orjson.JSONDecodeError
+            logger.error("Invalid JSON message: %s", raw_message[:100])
         except Exception as e:
-            logger.error(f"Error handling message: {e}")
+            logger.error("Error handling message: %s", e)
 
     async def _handle_orderbook_update(self, data: dict):
         """Handle order book update message."""
@@ -292,26 +384,50 @@ class WebSocketManager:
         if not token_id:
             return
 
-        # Parse bids and asks
-        bids = [(float(b["price"]), float(b["size"])) for b in data.get("bids", [])]
-        asks = [(float(a["price"]), float(a["size"])) for a in data.get("asks", [])]
-
-        update = OrderBookUpdate(
-            token_id=token_id,
-            bids=bids,
-            asks=asks,
-            is_snapshot=data.get("snapshot", False)
-        )
-
-        # Update cache
-        self._orderbook_cache[token_id] = update
-
-        # Notify callback
+        raw_bids = data.get("bids", [])
+        raw_asks = data.get("asks", [])
+
+        # Reuse the cached update's buffers when the book depth is
+        # unchanged — keeps allocation count flat under steady message
+        # flow instead of making every book a fresh object plus arrays
+        cached = self._orderbook_cache.get(token_id)
+        if (cached is not None
+                and len(cached.bids) == len(raw_bids)
+                and len(cached.asks) == len(raw_asks)):
+            _fill_levels(cached.bids, raw_bids)
+            _fill_levels(cached.asks, raw_asks)
+            cached.timestamp = time.monotonic()
+            cached.is_snapshot = data.get("snapshot", False)
+            update = cached
+        else:
+            update = OrderBookUpdate(
+                token_id=token_id,
+                bids=_parse_levels(raw_bids),
+                asks=_parse_levels(raw_asks),
+                is_snapshot=data.get("snapshot", False)
+            )
+            self._orderbook_cache[token_id] = update
+
+        # Wake any coroutine awaiting this token's next update;
+        # drop the oldest entry rather than block the receive loop
+        queue = self._update_queues.get(token_id)
+        if queue is not None:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(update)
+
+        # Notify callback; a persistently failing callback would
+        # otherwise emit one formatted error per message, so log the
+        # first failure with traceback and then only every 100th
         if self._on_orderbook_update:
             try:
                 self._on_orderbook_update(update)
-            except Exception as e:
-                logger.error(f"Order book callback error: {e}")
+            except Exception:
+                self._callback_errors += 1
+                if self._callback_errors % 100 == 1:
+                    logger.exception(
+                        "Order book callback error (count=%d)", self._callback_errors
+                    )
 
     async def _reconnect_with_backoff(self):
         """Reconnect with exponential backoff."""
@@ -325,6 +441,25 @@ class WebSocketManager:
             # Increase backoff
             self._backoff = min(self._backoff * 2, self._max_backoff)
 
+    async def next_book_update(self, token_id: str) -> OrderBookUpdate:
+        """
+        Await the next order book update for a market.
+
+        Blocks until the receive loop pushes a fresh book for the token,
+        so callers wake on the actual update instead of polling the cache.
+
+        Args:
+            token_id: The token ID
+
+        Returns:
+            The next OrderBookUpdate for the token
+        """
+        queue = self._update_queues.get(token_id)
+        if queue is None:
+            queue = asyncio.Queue(maxsize=16)
+            self._update_queues[token_id] = queue
+        return await queue.get()
+
     def get_orderbook(self, token_id: str) -> Optional[OrderBookUpdate]:
         """
         Get cached order book for a market.
@@ -345,12 +480,29 @@ class WebSocketManager:
             (best_bid, best_ask) or None
         """
         book = self._orderbook_cache.get(token_id)
-        if not book or not book.bids or not book.asks:
+        if book is None or len(book.bids) == 0 or len(book.asks) == 0:
             return None
 
-        best_bid = book.bids[0][0] if book.bids else 0
-        best_ask = book.asks[0][0] if book.asks else 1
-        return (best_bid, best_ask)
+        return (book.bids[0, 0], book.asks[0, 0])
+
+    def get_best_prices_into(self, token_id: str, out: np.ndarray) -> bool:
+        """
+        Fill out[0]=best_bid, out[1]=best_ask from the cached book.
+
+        Allocation-free variant of get_best_prices for callers that
+        poll in a loop: the caller owns a scratch array and the read is
+        two float64 loads — no tuple, no None check on the result.
+
+        Returns:
+            True if the book had both sides, False otherwise
+        """
+        book = self._orderbook_cache.get(token_id)
+        if book is None or book.bids.size == 0 or book.asks.size == 0:
+            return False
+
+        out[0] = book.bids[0, 0]
+        out[1] = book.asks[0, 0]
+        return True
 
     def get_stats(self) -> Dict:
         """Get WebSocket statistics."""
@@ -359,7 +511,7 @@ class WebSocketManager:
             "subscribed_markets": len(self._subscribed_markets),
             "cached_orderbooks": len(self._orderbook_cache),
             "messages_received": self._messages_received,
-            "last_message_age": time.time() - self._last_message_time if self._last_message_time else None
+            "last_message_age": time.monotonic() - self._last_message_time if self._last_message_time else None
         }
 
 
@@ -4,6 +4,7 @@ Polymarket Frontrun Bot - Launcher.
 Handles dependencies and starts the GUI application.
 """
 
+import importlib.util
 import os
 import sys
 import subprocess
@@ -34,16 +35,18 @@ def get_venv_python() -> str:
 
 
 def check_dependencies() -> bool:
-    """Check if required dependencies are installed."""
-    required = ['PySide6', 'qasync', 'py_clob_client', 'pydantic']
+    """Check if required dependencies are installed.
 
-    for package in required:
-        try:
-            __import__(package.replace('-', '_'))
-        except ImportError:
-            return False
+    Uses find_spec so the probe is a disk lookup — importing the GUI
+    toolkit here would execute its full module tree before the app
+    even starts.
+    """
+    required = ['PySide6', 'qasync', 'py_clob_client', 'pydantic']
 
-    return True
+    return all(
+        importlib.util.find_spec(package.replace('-', '_')) is not None
+        for package in required
+    )
 
 
 def install_dependencies():
@@ -103,18 +106,17 @@ def main():
     print("Starting application...")
     print("-" * 50)
 
-    # Set environment
-    env = os.environ.copy()
-    env['PYTHONPATH'] = str(PROJECT_DIR) + os.pathsep + env.get('PYTHONPATH', '')
-
-    # Run the GUI
-    result = subprocess.run(
-        [python, '-m', 'ui.app'],
-        cwd=str(PROJECT_DIR),
-        env=env
-    )
-
-    sys.exit(result.returncode)
+    if python == sys.executable:
+        # Already running on the right interpreter: import the app
+        # directly instead of paying a second interpreter startup
+        from ui.app import main as app_main
+        app_main()
+        return
+
+    # Replace this process with the venv interpreter — no launcher
+    # shim left resident while the GUI runs
+    os.environ['PYTHONPATH'] = str(PROJECT_DIR) + os.pathsep + os.environ.get('PYTHONPATH', '')
+    os.execv(python, [python, '-m', 'ui.app'])
 
 
 if __name__ == "__main__":
@@ -5,11 +5,13 @@ Modern interface with real-time charts, filters, and hotkeys.
 
 import sys
 import asyncio
+import bisect
 import threading
 import logging
+import queue
+import time
 from collections import deque
 from pathlib import Path
-from datetime import datetime
 from typing import List, Dict
 
 # Add project root to path
@@ -18,7 +20,9 @@ if str(project_root) not in sys.path:
     sys.path.insert(0, str(project_root))
 
 import customtkinter as ctk
+import numpy as np
 from tkinter import messagebox, Canvas
+from PIL import Image, ImageDraw, ImageTk
 
 # Configure CustomTkinter
 ctk.set_appearance_mode("dark")
@@ -59,10 +63,15 @@ class StatsCard(ctk.CTkFrame):
         self.value_label.pack(pady=(0, 10), padx=10)
 
     def set_value(self, value: str, color: str = None):
+        # Unchanged value: nothing to configure, no flash to schedule
+        if value == self._last_value:
+            if color:
+                self.value_label.configure(text_color=color)
+            return
+
         # Flash effect on change
-        if value != self._last_value:
-            self.configure(fg_color=COLORS['primary'])
-            self.after(200, lambda: self.configure(fg_color=COLORS['surface']))
+        self.configure(fg_color=COLORS['primary'])
+        self.after(200, lambda: self.configure(fg_color=COLORS['surface']))
         self._last_value = value
         self.value_label.configure(text=value)
         if color:
@@ -86,55 +95,114 @@ class PnLChart(ctk.CTkFrame):
         )
         self.canvas.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
-        # Data points - using deque for O(1) operations
+        # Cached canvas geometry, refreshed only on actual resize —
+        # winfo_width/height are Tk round-trips otherwise paid per frame
+        self._w = 300
+        self._h = 120
+        self.canvas.bind("<Configure>", self._on_resize)
+
+        # Data points - fixed-size ring buffer; the draw math runs
+        # vectorized over the whole window. float32 is plenty for
+        # pixel-resolution chart coordinates
         self.max_points = 50
-        self.pnl_history: deque = deque([0.0], maxlen=self.max_points)
+        self._buf = np.zeros(self.max_points, dtype=np.float32)
+        self._head = 1  # next write slot (slot 0 seeds the baseline)
+        self._count = 1
+
+        # Offscreen surface: compose the chart in PIL, blit one image
+        self._img = None
+        self._img_draw = None
+        self._photo = None
+        self._img_item = None
+        self._text_item = None
+
+        # Coalesce bursts of points into one paint per idle pass
+        self._redraw_scheduled = False
 
     def add_point(self, pnl: float):
-        """Add new P&L point. O(1) with deque."""
-        self.pnl_history.append(pnl)
+        """Add new P&L point. O(1) ring write; redraw is coalesced."""
+        self._buf[self._head] = pnl
+        self._head = (self._head + 1) % self.max_points
+        if self._count < self.max_points:
+            self._count += 1
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.after_idle(self._flush_redraw)
+
+    def _history(self) -> np.ndarray:
+        """Chronological view of the ring buffer."""
+        if self._count < self.max_points:
+            return self._buf[:self._count]
+        return np.concatenate((self._buf[self._head:], self._buf[:self._head]))
+
+    def _on_resize(self, event):
+        """Track canvas size and repaint at the new geometry."""
+        self._w = event.width
+        self._h = event.height
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Paint once for however many points arrived since last idle."""
+        self._redraw_scheduled = False
         self._draw_chart()
 
     def _draw_chart(self):
-        """Draw the P&L chart."""
-        self.canvas.delete("all")
-
-        if len(self.pnl_history) < 2:
+        """Draw the P&L chart into an offscreen image, then blit once."""
+        if self._count < 2:
             return
 
-        w = self.canvas.winfo_width() or 300
-        h = self.canvas.winfo_height() or 120
+        w = self._w
+        h = self._h
         padding = 10
 
-        # Calculate scale
-        min_val = min(self.pnl_history)
-        max_val = max(self.pnl_history)
-        range_val = max_val - min_val if max_val != min_val else 1
+        # (Re)build the surface only on resize; otherwise just clear it
+        if self._img is None or self._img.size != (w, h):
+            self._img = Image.new("RGB", (w, h), COLORS['bg'])
+            self._img_draw = ImageDraw.Draw(self._img)
+        else:
+            self._img_draw.rectangle((0, 0, w, h), fill=COLORS['bg'])
 
-        # Draw zero line
-        zero_y = h - padding - ((0 - min_val) / range_val) * (h - 2 * padding)
-        self.canvas.create_line(padding, zero_y, w - padding, zero_y, fill=COLORS['text_dim'], dash=(2, 2))
+        # Vectorized scale + coordinate math over the whole window
+        vals = self._history()
+        min_val = float(vals.min())
+        max_val = float(vals.max())
+        range_val = max_val - min_val if max_val != min_val else 1
+        y_scale = (h - 2 * padding) / range_val
 
-        # Draw line chart
-        points = []
-        for i, val in enumerate(self.pnl_history):
-            x = padding + (i / (len(self.pnl_history) - 1)) * (w - 2 * padding)
-            y = h - padding - ((val - min_val) / range_val) * (h - 2 * padding)
-            points.extend([x, y])
+        # Zero line
+        zero_y = int(h - padding - (0 - min_val) * y_scale)
+        self._img_draw.line((padding, zero_y, w - padding, zero_y), fill=COLORS['text_dim'])
 
-        if len(points) >= 4:
-            color = COLORS['success'] if self.pnl_history[-1] >= 0 else COLORS['danger']
-            self.canvas.create_line(points, fill=color, width=2, smooth=True)
+        # P&L polyline (integer coords; PIL rasters in C)
+        n = len(vals)
+        xs = (padding + np.arange(n) * ((w - 2 * padding) / (n - 1))).astype(np.int32)
+        ys = (h - padding - (vals - min_val) * y_scale).astype(np.int32)
+        points = list(zip(xs.tolist(), ys.tolist()))
 
-        # Current value label
-        current = self.pnl_history[-1]
+        current = float(vals[-1])
         color = COLORS['success'] if current >= 0 else COLORS['danger']
-        self.canvas.create_text(
-            w - padding, padding,
-            text=f"${current:+.2f}",
-            fill=color, font=("", 10, "bold"),
-            anchor="ne"
-        )
+        self._img_draw.line(points, fill=color, width=2)
+
+        # Single bitmap upload instead of per-item canvas updates
+        self._photo = ImageTk.PhotoImage(self._img)
+        if self._img_item is None:
+            self._img_item = self.canvas.create_image(0, 0, anchor="nw", image=self._photo)
+        else:
+            self.canvas.itemconfigure(self._img_item, image=self._photo)
+
+        # Current value label (persistent canvas item above the image)
+        if self._text_item is None:
+            self._text_item = self.canvas.create_text(
+                w - padding, padding,
+                text=f"${current:+.2f}",
+                fill=color, font=("", 10, "bold"),
+                anchor="ne"
+            )
+        else:
+            self.canvas.itemconfigure(self._text_item, text=f"${current:+.2f}", fill=color)
+            self.canvas.coords(self._text_item, w - padding, padding)
 
 
 class LogPanel(ctk.CTkFrame):
@@ -162,30 +230,84 @@ class LogPanel(ctk.CTkFrame):
         )
         self.log_text.pack(fill="both", expand=True, padx=10, pady=(0, 10))
 
+        # Pending lines, flushed into the textbox in one batch per
+        # 100ms window (capped so a burst can't queue unbounded work)
+        self._pending: deque = deque(maxlen=2000)
+        self._flush_scheduled = False
+
+        # Displayed-line cap: the Text widget keeps everything ever
+        # inserted otherwise, growing memory and relayout cost forever
+        self._max_lines = 1000
+        self._line_count = 0
+
+        # Timestamp string cache: formatted once per second, not per line
+        self._ts_sec = 0
+        self._ts_str = ""
+
     def add_log(self, level: str, message: str):
-        """Add log entry."""
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        """Queue a log entry; lines are flushed to Tk in batches."""
+        now = int(time.time())
+        if now != self._ts_sec:
+            self._ts_sec = now
+            self._ts_str = time.strftime("%H:%M:%S", time.localtime(now))
+        self._pending.append(f"[{self._ts_str}] {level:8} {message}\n")
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(100, self._flush)
+
+    def _flush(self):
+        """Insert all pending lines with one set of Tk calls."""
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+        added = len(self._pending)
+        lines = ''.join(self._pending)
+        self._pending.clear()
         self.log_text.configure(state="normal")
-        self.log_text.insert("end", f"[{timestamp}] {level:8} {message}\n")
+        self.log_text.insert("end", lines)
+        self._line_count += added
+        # Trim oldest lines past the cap in one delete
+        if self._line_count > self._max_lines:
+            overflow = self._line_count - self._max_lines
+            self.log_text.delete("1.0", f"{overflow + 1}.0")
+            self._line_count = self._max_lines
         self.log_text.see("end")
         self.log_text.configure(state="disabled")
 
     def clear(self):
+        self._pending.clear()
+        self._line_count = 0
         self.log_text.configure(state="normal")
         self.log_text.delete("1.0", "end")
         self.log_text.configure(state="disabled")
 
 
+def _neg_spread(data: dict) -> float:
+    """Sort key keeping market lists ordered widest-spread-first."""
+    return -data.get('spread', 0)
+
+
 class MarketsTable(ctk.CTkScrollableFrame):
     """Markets display table with filtering."""
 
+    # Upper bound on materialized rows; markets are spread-sorted so
+    # everything past this is far from being an opportunity anyway
+    MAX_RENDERED_ROWS = 40
+
     def __init__(self, parent, **kwargs):
         super().__init__(parent, **kwargs)
         self.configure(fg_color=COLORS['surface'], corner_radius=10)
-        self.rows = []
+        # Pool of (frame, labels) rows, recycled across refreshes —
+        # widget construction dominates refresh cost, text updates don't
+        self._row_pool: List[tuple] = []
+        self._visible_rows = 0
         self.all_markets: List[Dict] = []
         self.filter_text = ""
+        self._filter_tokens: tuple = ()
         self.only_opportunities = False
+        # Markets matching the current filter; a refined filter (typing
+        # another character) narrows this set instead of rescanning all
+        self._match_cache: List[Dict] = None
 
         # Header
         header = ctk.CTkFrame(self, fg_color=COLORS['primary'], corner_radius=5)
@@ -202,66 +324,122 @@ class MarketsTable(ctk.CTkScrollableFrame):
 
     def set_filter(self, text: str, only_opps: bool = False):
         """Set filter criteria."""
-        self.filter_text = text.lower()
+        text = text.lower()
+
+        # A longer filter with the same flags only ever removes matches,
+        # so narrow the previous result set rather than rescanning
+        if (self._match_cache is not None
+                and only_opps == self.only_opportunities
+                and text.startswith(self.filter_text)):
+            candidates = self._match_cache
+        else:
+            candidates = self.all_markets
+
+        self.filter_text = text
+        # Tokenized once per filter change, not re-split per row;
+        # whitespace-separated tokens are ANDed together
+        self._filter_tokens = tuple(text.split())
         self.only_opportunities = only_opps
-        self._refresh_display()
+        self._match_cache = [d for d in candidates if self._matches_filter(d)]
+        self._render(self._match_cache)
 
     def add_market(self, data: dict):
-        """Add market to internal list."""
-        self.all_markets.append(data)
+        """Add market to internal list (kept sorted by spread)."""
+        bisect.insort(self.all_markets, data, key=_neg_spread)
         if self._matches_filter(data):
-            self._add_row(data)
+            self._refresh_display()
 
     def update_markets(self, markets: List[Dict]):
         """Replace all markets."""
-        self.all_markets = markets
+        self.all_markets = sorted(markets, key=_neg_spread)
         self._refresh_display()
 
+    @staticmethod
+    def _is_opp(data: dict) -> bool:
+        """Opportunity flag, computed once per market and cached."""
+        flag = data.get('_is_opp')
+        if flag is None:
+            flag = data['_is_opp'] = data.get('spread', 0) >= 0.10
+        return flag
+
     def _matches_filter(self, data: dict) -> bool:
-        """Check if market matches current filter."""
-        name = data.get('market_name', '').lower()
-        if self.filter_text and self.filter_text not in name:
-            return False
-        if self.only_opportunities and data.get('spread', 0) < 0.10:
+        """Check if market matches current filter (all tokens must hit)."""
+        if self._filter_tokens:
+            # Lowercase once per market, not once per keystroke per market
+            name = data.get('_name_lc')
+            if name is None:
+                name = data['_name_lc'] = data.get('market_name', '').lower()
+            for token in self._filter_tokens:
+                if token not in name:
+                    return False
+        if self.only_opportunities and not self._is_opp(data):
             return False
         return True
 
     def _refresh_display(self):
-        """Refresh displayed rows based on filter."""
-        self.clear()
-        # Sort by spread descending
-        sorted_markets = sorted(self.all_markets, key=lambda x: x.get('spread', 0), reverse=True)
-        for data in sorted_markets:
+        """Re-filter from scratch after the market list changed."""
+        self._match_cache = None
+        matches = []
+        for data in self.all_markets:
+            # Spread-sorted list: once spreads drop below the threshold
+            # there are no opportunities left to find
+            if self.only_opportunities and not self._is_opp(data):
+                break
             if self._matches_filter(data):
-                self._add_row(data)
-
-    def _add_row(self, data: dict):
-        """Add a visual row."""
+                matches.append(data)
+        self._render(matches)
+
+    def _render(self, markets: List[Dict]):
+        """Show the given (pre-sorted, pre-filtered) markets."""
+        shown = 0
+        for data in markets:
+            self._show_row(shown, data)
+            shown += 1
+            if shown >= self.MAX_RENDERED_ROWS:
+                break
+
+        # Hide leftover pooled rows instead of destroying them
+        for frame, _ in self._row_pool[shown:self._visible_rows]:
+            frame.pack_forget()
+        self._visible_rows = shown
+
+    def _make_row(self) -> tuple:
+        """Build one pooled row: a frame with five labels."""
         row = ctk.CTkFrame(self, fg_color="transparent")
-        row.pack(fill="x", padx=5, pady=2)
+        labels = []
+        for width, anchor in ((250, "w"), (70, "center"), (70, "center"),
+                              (70, "center"), (80, "center")):
+            label = ctk.CTkLabel(row, text="", width=width, anchor=anchor)
+            label.pack(side="left", padx=5)
+            labels.append(label)
+        return (row, labels)
+
+    def _show_row(self, index: int, data: dict):
+        """Fill pooled row `index` with market data, creating on demand."""
+        if index < len(self._row_pool):
+            row, labels = self._row_pool[index]
+        else:
+            row, labels = self._make_row()
+            self._row_pool.append((row, labels))
 
-        name = data.get('market_name', 'Unknown')[:35]
-        bid = f"${data.get('best_bid', 0):.3f}"
-        ask = f"${data.get('best_ask', 0):.3f}"
         spread = data.get('spread', 0)
-        spread_text = f"${spread:.3f}"
         status = data.get('status', 'Scanning')
-
         spread_color = COLORS['success'] if spread >= 0.10 else COLORS['text']
         status_color = COLORS['success'] if status == 'Opportunity' else COLORS['text']
 
-        ctk.CTkLabel(row, text=name, width=250, anchor="w").pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=bid, width=70).pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=ask, width=70).pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=spread_text, width=70, text_color=spread_color).pack(side="left", padx=5)
-        ctk.CTkLabel(row, text=status, width=80, text_color=status_color).pack(side="left", padx=5)
+        labels[0].configure(text=data.get('market_name', 'Unknown')[:35])
+        labels[1].configure(text=f"${data.get('best_bid', 0):.3f}")
+        labels[2].configure(text=f"${data.get('best_ask', 0):.3f}")
+        labels[3].configure(text=f"${spread:.3f}", text_color=spread_color)
+        labels[4].configure(text=status, text_color=status_color)
 
-        self.rows.append(row)
+        # Repacking keeps rows in iteration order (moves to end)
+        row.pack(fill="x", padx=5, pady=2)
 
     def clear(self):
-        for row in self.rows:
-            row.destroy()
-        self.rows.clear()
+        for frame, _ in self._row_pool[:self._visible_rows]:
+            frame.pack_forget()
+        self._visible_rows = 0
 
 
 class SettingsPanel(ctk.CTkScrollableFrame):
@@ -372,6 +550,12 @@ class FrontrunBotApp(ctk.CTk):
         self.is_running = False
         self.async_loop = None
 
+        # Stats snapshots pushed by the bot thread, drained by a Tk timer
+        self.stats_q: queue.SimpleQueue = queue.SimpleQueue()
+
+        # UI -> bot command channel, consumed by one dispatcher task
+        self.cmd_q: asyncio.Queue = None
+
         self._init_bot()
         self._create_ui()
         self._setup_hotkeys()
@@ -388,7 +572,7 @@ class FrontrunBotApp(ctk.CTk):
                 on_log=self.log,
                 on_market_update=self._on_market_update,
                 on_trade=self._on_trade,
-                on_stats_update=self._on_stats_update
+                on_stats_update=self.stats_q.put_nowait
             )
         except Exception as e:
             logging.error(f"Failed to initialize bot: {e}")
@@ -472,7 +656,9 @@ class FrontrunBotApp(ctk.CTk):
             self.stat_cards[title] = card
 
         # Tabs
-        self.tabview = ctk.CTkTabview(content, fg_color=COLORS['surface'])
+        self.tabview = ctk.CTkTabview(
+            content, fg_color=COLORS['surface'], command=self._on_tab_change
+        )
         self.tabview.pack(fill="both", expand=True)
 
         # Dashboard tab
@@ -523,15 +709,27 @@ class FrontrunBotApp(ctk.CTk):
         self.log_panel = LogPanel(right_column)
         self.log_panel.pack(fill="both", expand=True)
 
-        # Settings tab
-        settings = self.tabview.add("Settings")
-        self.settings_panel = SettingsPanel(settings, self)
-        self.settings_panel.pack(fill="both", expand=True, padx=10, pady=10)
+        # Settings tab: built on first visit, not at startup — the
+        # panel costs ~8 entry rows plus a settings load most runs
+        # never look at
+        self.tabview.add("Settings")
+        self.settings_panel = None
 
         # Initial log
         self.log("INFO", "Application started")
         self.log("INFO", "Hotkeys: Ctrl+S=Start/Stop, Ctrl+R=Refresh, Esc=Emergency Stop")
 
+    def _on_tab_change(self):
+        """Build lazily-constructed tabs when first selected."""
+        if self.tabview.get() == "Settings":
+            self._ensure_settings_panel()
+
+    def _ensure_settings_panel(self):
+        """Construct the settings panel on first use."""
+        if self.settings_panel is None:
+            self.settings_panel = SettingsPanel(self.tabview.tab("Settings"), self)
+            self.settings_panel.pack(fill="both", expand=True, padx=10, pady=10)
+
     def _apply_filter(self):
         """Apply search filter to markets."""
         text = self.filter_entry.get()
@@ -540,26 +738,41 @@ class FrontrunBotApp(ctk.CTk):
 
     def _start_async_loop(self):
         """Start async event loop in separate thread."""
+        # Created before the thread starts so _post_command never sees a
+        # half-initialized loop; the queue binds to the loop on first use
+        self.cmd_q = asyncio.Queue()
+
         def run_loop():
+            # uvloop cuts per-callback overhead on the bot's I/O path;
+            # fall back silently where it isn't available (Windows)
+            try:
+                import uvloop
+                uvloop.install()
+            except ImportError:
+                pass
             self.async_loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.async_loop)
+            self.async_loop.create_task(self._dispatch_commands())
             self.async_loop.run_forever()
 
         thread = threading.Thread(target=run_loop, daemon=True)
         thread.start()
 
     def _start_stats_timer(self):
-        """Start timer for periodic UI updates."""
-        def update():
-            if self.is_running and self.bot:
-                try:
-                    stats = self.bot.get_stats()
-                    self._on_stats_update(stats)
-                except Exception as e:
-                    logging.debug(f"Stats update error: {e}")
-            self.after(1000, update)
-
-        self.after(1000, update)
+        """Drain pushed stats snapshots; idle ticks do no bot work."""
+        def drain():
+            # Keep only the newest snapshot if several queued up
+            stats = None
+            try:
+                while True:
+                    stats = self.stats_q.get_nowait()
+            except queue.Empty:
+                pass
+            if stats is not None:
+                self._on_stats_update(stats)
+            self.after(250, drain)
+
+        self.after(250, drain)
 
     def log(self, level: str, message: str):
         """Add log entry (thread-safe)."""
@@ -582,16 +795,30 @@ class FrontrunBotApp(ctk.CTk):
                 "Configuration Required",
                 "Please configure your private key in the Settings tab."
             )
+            # Programmatic tab switch doesn't fire the tab command
+            self._ensure_settings_panel()
             self.tabview.set("Settings")
             return
 
         self.log("INFO", "Starting bot...")
+        self._post_command('start')
 
+    def _post_command(self, op: str):
+        """Post an opcode to the bot dispatcher (thread-safe)."""
         if self.bot and self.async_loop:
-            asyncio.run_coroutine_threadsafe(
-                self._async_start_bot(),
-                self.async_loop
-            )
+            self.async_loop.call_soon_threadsafe(self.cmd_q.put_nowait, op)
+
+    async def _dispatch_commands(self):
+        """Long-lived consumer turning UI opcodes into bot coroutines."""
+        handlers = {
+            'start': self._async_start_bot,
+            'stop': self._async_stop_bot,
+        }
+        while True:
+            op = await self.cmd_q.get()
+            handler = handlers.get(op)
+            if handler is not None:
+                await handler()
 
     async def _async_start_bot(self):
         """Async bot start."""
@@ -608,12 +835,7 @@ class FrontrunBotApp(ctk.CTk):
     def stop_bot(self):
         """Stop the trading bot."""
         self.log("INFO", "Stopping bot...")
-
-        if self.bot and self.async_loop:
-            asyncio.run_coroutine_threadsafe(
-                self._async_stop_bot(),
-                self.async_loop
-            )
+        self._post_command('stop')
 
     async def _async_stop_bot(self):
         """Async bot stop."""
@@ -655,33 +877,35 @@ class FrontrunBotApp(ctk.CTk):
         self.log("TRADE", f"{side} on {market} | Profit: ${profit:.2f}")
 
     def _on_stats_update(self, stats: dict):
-        """Handle stats update."""
-        def update():
-            risk = stats.get('risk', {})
-            today = risk.get('today', {})
-
-            # Update bankroll
-            bankroll = risk.get('current_bankroll', 100)
-            self.stat_cards["BANKROLL"].set_value(f"${bankroll:.2f}")
-
-            # Update P&L with chart
-            pnl = risk.get('total_pnl', 0)
-            pnl_color = COLORS['success'] if pnl >= 0 else COLORS['danger']
-            self.stat_cards["TOTAL P&L"].set_value(f"${pnl:+.2f}", pnl_color)
-            self.pnl_chart.add_point(pnl)
-
-            # Trades and win rate
-            trades = today.get('trades', 0)
-            wins = today.get('wins', 0)
-            self.stat_cards["TRADES"].set_value(str(trades))
-            winrate = (wins / trades * 100) if trades > 0 else 0
-            self.stat_cards["WIN RATE"].set_value(f"{winrate:.0f}%")
-
-            # Cycles
-            cycles = stats.get('cycles_run', 0)
-            self.stat_cards["CYCLES"].set_value(str(cycles))
-
-        self.after(0, update)
+        """Handle stats update (strings are built on the caller thread)."""
+        risk = stats.get('risk', {})
+        today = risk.get('today', {})
+
+        bankroll = risk.get('current_bankroll', 100)
+        pnl = risk.get('total_pnl', 0)
+        trades = today.get('trades', 0)
+        wins = today.get('wins', 0)
+        winrate = (wins / trades * 100) if trades > 0 else 0
+
+        display = {
+            'bankroll': f"${bankroll:.2f}",
+            'pnl': f"${pnl:+.2f}",
+            'pnl_value': pnl,
+            'pnl_color': COLORS['success'] if pnl >= 0 else COLORS['danger'],
+            'trades': str(trades),
+            'winrate': f"{winrate:.0f}%",
+            'cycles': str(stats.get('cycles_run', 0)),
+        }
+        self.after(0, lambda d=display: self._apply_stats(d))
+
+    def _apply_stats(self, display: dict):
+        """Apply pre-formatted stat strings on the Tk thread."""
+        self.stat_cards["BANKROLL"].set_value(display['bankroll'])
+        self.stat_cards["TOTAL P&L"].set_value(display['pnl'], display['pnl_color'])
+        self.pnl_chart.add_point(display['pnl_value'])
+        self.stat_cards["TRADES"].set_value(display['trades'])
+        self.stat_cards["WIN RATE"].set_value(display['winrate'])
+        self.stat_cards["CYCLES"].set_value(display['cycles'])
 
     def refresh_markets(self):
         """Refresh markets list."""
@@ -699,17 +923,11 @@ class FrontrunBotApp(ctk.CTk):
 
 
 def setup_logging():
-    """Configure logging."""
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s | %(levelname)-8s | %(message)s',
-        datefmt='%H:%M:%S',
-        handlers=[
-            logging.StreamHandler(sys.stdout),
-            logging.FileHandler('bot.log', encoding='utf-8')
-        ]
-    )
-    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    """Configure logging (delegates to the bot's queue-based setup)."""
+    # The bot routes records through a QueueListener thread so neither
+    # the Tk thread nor the event loop blocks on console/file I/O
+    from bot import setup_logging as bot_setup_logging
+    bot_setup_logging()
 
 
 def main():